@@ -20,10 +20,14 @@ Usage:
     python -m scripts.sync.status_sync --target prod
 """
 
-from .phone_normalize import normalize_phone, phones_match, extract_phone_variants
+from .phone_normalize import normalize_phone, normalize_phones, phones_match, extract_phone_variants
+from .phone_index import PhoneIndex, phone_key
 
 __all__ = [
     'normalize_phone',
+    'normalize_phones',
     'phones_match',
     'extract_phone_variants',
+    'PhoneIndex',
+    'phone_key',
 ]
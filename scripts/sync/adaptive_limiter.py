@@ -0,0 +1,128 @@
+"""
+Adaptive (AIMD) cap on concurrent HTTP requests.
+
+Used by status_sync.py --write-workers to spread per-lead Supabase writes
+over a thread pool without overrunning PostgREST. The cap starts at the
+worker count and is halved when the server answers 429 or 5xx (or the
+request fails outright), at most once per round of requests in flight.
+It grows back by about one per round of requests answered within
+LATENCY_HEALTHY_FACTOR of the fastest response seen so far.
+
+429 and 503 mean the request was not processed, so send_request() sends it
+again after a backoff (Retry-After if given); other statuses are returned
+to the caller as is.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+import requests
+
+
+def is_throttle_status(status_code: int) -> bool:
+    """Whether a response means the server wants fewer requests."""
+    return status_code == 429 or status_code >= 500
+
+
+# Throttle statuses where the request certainly was not processed and
+# can be sent again, even for non-idempotent POSTs
+RETRY_STATUSES = {429, 503}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# A response this many times slower than the fastest one seen counts as
+# queueing on the server: the cap is held instead of grown
+LATENCY_HEALTHY_FACTOR = 2.0
+
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD limit on requests in flight."""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = float(self.max_limit)
+        self.lowest_limit = self.max_limit
+        self.in_flight = 0
+        self.throttled = 0
+        self.retries = 0
+        self._fastest: Optional[float] = None
+        self._backed_off_at = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> float:
+        """Wait for a free slot. Returns the start time to pass to release()."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started: float, status_code: Optional[int]) -> None:
+        """Free a slot and adjust the cap (status_code None = the request raised)."""
+        latency = time.monotonic() - started
+        with self._cond:
+            self.in_flight -= 1
+            if status_code is None or is_throttle_status(status_code):
+                self.throttled += 1
+                # Requests sent before the last cut were answered under the old
+                # cap, so they don't cut it again
+                if started >= self._backed_off_at:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.lowest_limit = min(self.lowest_limit, int(self.limit))
+                    self._backed_off_at = time.monotonic()
+            else:
+                if self._fastest is None or latency < self._fastest:
+                    self._fastest = latency
+                if latency <= LATENCY_HEALTHY_FACTOR * self._fastest:
+                    self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def note_retry(self) -> None:
+        with self._cond:
+            self.retries += 1
+
+    def summary(self) -> str:
+        return (f"{self.throttled} throttled responses, {self.retries} retries, "
+                f"concurrency {int(self.limit)}/{self.max_limit} (lowest {self.lowest_limit})")
+
+
+def retry_delay(response: requests.Response, attempt: int) -> float:
+    """Seconds to wait before sending a throttled request again."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+    # Jitter keeps the workers that were throttled together from retrying together
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) * random.uniform(0.5, 1.0)
+
+
+def send_request(
+    method: Callable[..., requests.Response],
+    url: str,
+    limiter: Optional[AdaptiveLimiter] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send method(url, **kwargs) within the limiter's cap.
+
+    Without a limiter this is a plain call. With one, 429/503 responses are
+    retried up to MAX_RETRIES times; the last response is returned either way.
+    """
+    if limiter is None:
+        return method(url, **kwargs)
+
+    attempt = 0
+    while True:
+        started = limiter.acquire()
+        response = None
+        try:
+            response = method(url, **kwargs)
+        finally:
+            limiter.release(started, response.status_code if response is not None else None)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        limiter.note_retry()
+        time.sleep(retry_delay(response, attempt))
+        attempt += 1
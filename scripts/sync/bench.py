@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Sync Pipeline Benchmarks
+
+Throughput micro-benchmarks on synthetic data, for checking performance
+work on the reconcile/status_sync hot paths. Nothing talks to Zoho or
+Supabase.
+
+Usage:
+    python scripts/sync/bench.py                      # Run every benchmark at its default size
+    python scripts/sync/bench.py phones --n 2000000   # Phone normalization only
+    python scripts/sync/bench.py ledger               # Match ledger reuse, and report equality
+    python scripts/sync/bench.py names --n 2000       # NumPy vs index name engine, and report equality
+    python scripts/sync/bench.py external             # Out-of-core vs in-memory matching on mixed keys
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.sync.external_reconcile import reconcile_out_of_core
+from scripts.sync.phone_normalize import normalize_phone, normalize_phones
+from scripts.sync.reconcile import (
+    MatchResult,
+    SupabaseLead,
+    ZohoLead,
+    generate_reconciliation_report,
+    stream_reconciliation,
+)
+
+
+PHONE_FORMATS = [
+    "05{}{}",
+    "05{}-{}",
+    "+972-5{}-{}",
+    "9725{}{}",
+    "5{}{}",
+    "(05{}) {}",
+    "05{} {}",
+]
+
+
+def make_phones(n: int, unique_ratio: float, seed: int = 0) -> list[str]:
+    """Mixed-format Israeli mobile numbers, about unique_ratio * n distinct."""
+    rng = random.Random(seed)
+    pool_size = max(1, int(n * unique_ratio))
+    pool = [
+        rng.choice(PHONE_FORMATS).format(rng.randint(0, 9), f"{rng.randint(0, 9999999):07d}")
+        for _ in range(pool_size)
+    ]
+    return [pool[rng.randrange(pool_size)] for _ in range(n)]
+
+
+FIRST_NAMES = ["דנה", "רון", "נועה", "אבי", "משה", "שרה", "Dana", "Ron", "Noa", "David", "Lior", "Tal"]
+LAST_NAMES = ["כהן", "לוי", "מזרחי", "פרץ", "ביטון", "Cohen", "Levi", "Smith", "Azulay", "Dahan"]
+
+
+def make_leads(n: int, seed: int = 0) -> tuple[list[ZohoLead], list[SupabaseLead]]:
+    """
+    n Supabase leads and n // 2 Zoho leads.
+
+    Zoho leads copy a random Supabase lead's phone (80%), email only or
+    name only (5% each), or are new (10%); the last three reach the name
+    stage, which dominates the run time.
+    """
+    rng = random.Random(seed)
+    phones = make_phones(n, 1.0, seed)
+    supabase_leads = [
+        SupabaseLead(
+            id=f"{i:032x}",
+            name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.randint(0, n)}",
+            email=f"lead{i}@example.com" if rng.random() < 0.7 else None,
+            phone=phones[i] if rng.random() < 0.9 else None,
+            status=rng.choice(['no_answer', 'meeting_set', 'signed']),
+            created_at='2026-01-01T10:00:00+00:00',
+        )
+        for i in range(n)
+    ]
+
+    zoho_leads = []
+    for i in range(n // 2):
+        source = supabase_leads[rng.randrange(n)]
+        kind = rng.random()
+        name, phone, email = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.randint(0, n)}", None, None
+        if kind < 0.8:
+            phone = source.normalized_phone
+        elif kind < 0.85:
+            email = source.email
+        elif kind < 0.9:
+            name = source.name
+        zoho_leads.append(ZohoLead(
+            id=f"z{i}", name=name, email=email, phone=phone,
+            status=rng.choice(['no_answer', 'meeting_set', 'signed']), status_raw='', created_at='',
+        ))
+    return zoho_leads, supabase_leads
+
+
+def normalize_phone_regex(phone):
+    """The original per-call re.sub implementation, as a baseline."""
+    if not phone:
+        return None
+    digits = re.sub(r'[^0-9]', '', phone)
+    if digits.startswith('972'):
+        digits = '0' + digits[3:]
+    if len(digits) == 9 and digits.startswith('5'):
+        digits = '0' + digits
+    return digits if len(digits) >= 7 else None
+
+
+def report(label: str, count: int, seconds: float) -> None:
+    rate = count / seconds if seconds else float('inf')
+    print(f"  {label:<44} {seconds:8.3f}s  {rate / 1e6:8.2f} M/s")
+
+
+def timed(label: str, count: int, fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    fn()
+    report(label, count, time.perf_counter() - start)
+
+
+# ============================================
+# Benchmarks
+# ============================================
+
+def bench_phones(n: int) -> None:
+    """normalize_phone vs the batch/vectorized normalize_phones paths."""
+    for unique_ratio in (1.0, 0.1, 0.01):
+        phones = make_phones(n, unique_ratio)
+        print(f"\nPhone normalization: {n:,} phones, ~{unique_ratio:.0%} unique")
+
+        timed("re.sub baseline", n, lambda: [normalize_phone_regex(p) for p in phones])
+        uncached = normalize_phone.__wrapped__
+        timed("normalize_phone (no memo)", n, lambda: [uncached(p) for p in phones])
+        normalize_phone.cache_clear()
+        timed("normalize_phone (LRU memo, cold)", n, lambda: [normalize_phone(p) for p in phones])
+        timed("normalize_phone (LRU memo, warm)", n, lambda: [normalize_phone(p) for p in phones])
+        timed("normalize_phones(list)", n, lambda: normalize_phones(phones))
+
+        try:
+            import numpy as np
+            array = np.array(phones, dtype=object)
+            timed("normalize_phones(numpy)", n, lambda: normalize_phones(array))
+        except ImportError:
+            print("  numpy not installed, skipping")
+
+        try:
+            import pyarrow as pa
+            arrow = pa.array(phones)
+            timed("normalize_phones(pyarrow)", n, lambda: normalize_phones(arrow))
+        except ImportError:
+            print("  pyarrow not installed, skipping")
+
+
+def unslotted(cls: type) -> type:
+    """A plain (__dict__-backed) dataclass copy of a slotted record class."""
+    fields = [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(cls)]
+    namespace = {'__post_init__': cls.__post_init__} if hasattr(cls, '__post_init__') else {}
+    return dataclasses.make_dataclass(f'Plain{cls.__name__}', fields, namespace=namespace)
+
+
+def measure_records(label: str, n: int, build: Callable[[int], object]) -> None:
+    """Construction time, then retained memory (tracemalloc) for n records."""
+    start = time.perf_counter()
+    records = [build(i) for i in range(n)]
+    seconds = time.perf_counter() - start
+    del records
+
+    tracemalloc.start()
+    records = [build(i) for i in range(n)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    report(label, n, seconds)
+    print(f"  {'':<44} {retained / n:8.0f} bytes/record")
+
+
+def bench_records(n: int) -> None:
+    """
+    Slotted vs __dict__ lead/match records.
+
+    Field strings are built up front and shared by both variants; retained
+    bytes cover the record itself, its list slot and, for leads, the
+    normalized phone string.
+    """
+    phones = make_phones(n, 1.0)
+    names = [f"ישראל ישראלי {i}" for i in range(n)]
+    emails = [f"lead{i}@example.com" for i in range(n)]
+    ids = [f"{i:032x}" for i in range(n)]
+    normalize_phones(phones)
+
+    print(f"\nLead records: {n:,} each (construction rate, retained bytes/record)")
+    for cls in (ZohoLead, unslotted(ZohoLead)):
+        measure_records(cls.__name__, n, lambda i: cls(
+            id=ids[i], name=names[i], email=emails[i], phone=phones[i],
+            status='no_answer', status_raw='אין מענה', created_at='2026-01-01T10:00:00+02:00',
+        ))
+    for cls in (SupabaseLead, unslotted(SupabaseLead)):
+        measure_records(cls.__name__, n, lambda i: cls(
+            id=ids[i], name=names[i], email=emails[i], phone=phones[i],
+            status='no_answer', created_at='2026-01-01T10:00:00+00:00',
+        ))
+    for cls in (MatchResult, unslotted(MatchResult)):
+        measure_records(cls.__name__, n, lambda i: cls(
+            zoho_id=ids[i], zoho_name=names[i], zoho_status='no_answer', zoho_phone=phones[i],
+            zoho_email=emails[i], zoho_notes=None, supabase_id=ids[i], supabase_name=names[i],
+            supabase_status='no_answer', match_type='phone', match_confidence=1.0, status_differs=False,
+        ))
+
+
+def bench_ledger(n: int) -> None:
+    """
+    Reconciliation with a warm match ledger vs a fresh run.
+
+    The ledger is built over every Zoho lead, then used for a run over the
+    newer half only (a shorter --days window): its pairs for the older
+    half must not change the report.
+    """
+    zoho_leads, supabase_leads = make_leads(n)
+    window = zoho_leads[:len(zoho_leads) // 2]
+    print(f"\nMatch ledger: {len(window):,} of {len(zoho_leads):,} Zoho x {len(supabase_leads):,} Supabase leads")
+
+    def run(fn: Callable[[], object]) -> tuple[float, tuple]:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = fn()
+        return time.perf_counter() - start, (
+            [dataclasses.astuple(m) for m in report.matches],
+            [lead['id'] for lead in report.unmatched_supabase],
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_path = Path(tmp) / 'ledger.sqlite'
+        baseline, expected = run(lambda: generate_reconciliation_report(window, supabase_leads))
+        print(f"  {'fresh run':<44} {baseline:8.3f}s  {1.0:6.2f}x")
+        run(lambda: generate_reconciliation_report(zoho_leads, supabase_leads, ledger_path=ledger_path))
+
+        runs = {
+            'warm ledger': lambda: generate_reconciliation_report(
+                window, supabase_leads, ledger_path=ledger_path, update_ledger=False),
+            'warm ledger, streaming': lambda: stream_reconciliation(
+                iter([window[:len(window) // 2], window[len(window) // 2:]]), lambda: supabase_leads,
+                ledger_path=ledger_path, update_ledger=False),
+        }
+        for label, fn in runs.items():
+            seconds, result = run(fn)
+            same = 'identical' if result == expected else 'DIFFERENT'
+            print(f"  {label:<44} {seconds:8.3f}s  {baseline / seconds:6.2f}x  {same}")
+
+
+def bench_names(n: int) -> None:
+    """--name-engine numpy vs the default index engine: wall time and report equality."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("\nName engines: numpy not installed, skipping")
+        return
+
+    zoho_leads, supabase_leads = make_leads(n)
+    print(f"\nName engines: {len(zoho_leads):,} Zoho x {len(supabase_leads):,} Supabase leads")
+
+    def run(fn: Callable[[], object]) -> tuple[float, list]:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = fn()
+        return time.perf_counter() - start, [dataclasses.astuple(m) for m in report.matches]
+
+    # No Supabase leads loaded: main() only warns and carries on
+    for label, sb_leads in (('', supabase_leads), (', no Supabase leads', [])):
+        baseline, expected = run(lambda: generate_reconciliation_report(zoho_leads, sb_leads))
+        print(f"  {'index' + label:<44} {baseline:8.3f}s  {1.0:6.2f}x")
+        seconds, matches = run(lambda: generate_reconciliation_report(zoho_leads, sb_leads, name_engine='numpy'))
+        same = 'identical' if matches == expected else 'DIFFERENT'
+        print(f"  {'numpy' + label:<44} {seconds:8.3f}s  {baseline / seconds:6.2f}x  {same}")
+
+
+def bench_external(n: int) -> None:
+    """
+    Out-of-core vs in-memory phone/email matching on leads with both keys.
+
+    Zoho leads carry a phone and an email. With single-key Supabase leads
+    the two reports must be identical; when some Supabase leads have both
+    keys they may differ (phone matches win out of core), but then
+    reconcile_out_of_core must have warned.
+    """
+    zoho_leads, supabase_leads = make_leads(n)
+    rng = random.Random(1)
+    zoho_leads = [
+        dataclasses.replace(
+            lead, phone=lead.phone or rng.choice(supabase_leads).phone, email=rng.choice(supabase_leads).email,
+        )
+        for lead in zoho_leads
+    ]
+    single_key = [
+        dataclasses.replace(lead, email=None) if lead.phone and i % 2 else dataclasses.replace(lead, phone=None)
+        for i, lead in enumerate(supabase_leads)
+    ]
+    print(f"\nOut of core: {len(zoho_leads):,} Zoho x {len(supabase_leads):,} Supabase leads, "
+          f"Zoho leads with phone and email")
+
+    def key(match: dict) -> tuple:
+        return match['zoho_id'], match['supabase_id'], match['match_type']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / 'report.json'
+        for label, sb_leads in (('single-key Supabase', single_key), ('both keys on both sides', supabase_leads)):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                report = generate_reconciliation_report(zoho_leads, sb_leads, match_names=False)
+            baseline = time.perf_counter() - start
+            expected = [key(dataclasses.asdict(m)) for m in report.matches]
+
+            log = io.StringIO()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(log):
+                reconcile_out_of_core(iter(zoho_leads), iter(sb_leads), str(output_path), run_size=max(1, n // 8))
+            seconds = time.perf_counter() - start
+            with open(output_path, encoding='utf-8') as f:
+                matches = [key(m) for m in json.load(f)['matches']]
+
+            if matches == expected:
+                same = 'identical'
+            else:
+                same = 'differs, warned' if '[WARN]' in log.getvalue() else 'DIFFERENT'
+            print(f"  {'in memory, ' + label:<44} {baseline:8.3f}s  {1.0:6.2f}x")
+            print(f"  {'out of core, ' + label:<44} {seconds:8.3f}s  {baseline / seconds:6.2f}x  {same}")
+
+
+# Benchmark -> (function, default --n). The reconciliation benchmarks
+# score names pairwise, so they default to far fewer records
+BENCHMARKS = {
+    'phones': (bench_phones, 1_000_000),
+    'records': (bench_records, 1_000_000),
+    'ledger': (bench_ledger, 5_000),
+    'names': (bench_names, 5_000),
+    'external': (bench_external, 50_000),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the sync pipeline hot paths')
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK',
+                        help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument('--n', type=int, default=None,
+                        help='Records per benchmark (default: ' +
+                             ', '.join(f'{name} {n:,}' for name, (_, n) in BENCHMARKS.items()) + ')')
+    args = parser.parse_args()
+
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    for name in args.benchmarks or BENCHMARKS:
+        bench, default_n = BENCHMARKS[name]
+        bench(args.n if args.n is not None else default_n)
+
+
+if __name__ == '__main__':
+    main()
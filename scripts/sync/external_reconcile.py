@@ -0,0 +1,337 @@
+"""
+Out-of-core lead reconciliation for lead sets larger than memory.
+
+Both sides are spilled to disk as sorted runs (JSON lines) and k-way merged
+with heapq.merge, then paired with merge joins: first on normalized phone,
+then what is left on email. Results are sorted back into Zoho order on disk
+and the report is written to JSON incrementally, so memory stays bounded by
+run_size records per spill, whatever the table sizes.
+
+Differences from generate_reconciliation_report (in memory):
+- No fuzzy name stage; leads without a phone/email match are unmatched.
+- Every phone match is resolved before any email match. In memory an
+  earlier Zoho lead can claim a Supabase lead by email before a later Zoho
+  lead reaches it by phone; here the phone match wins. Within one key the
+  pairing is the same: the n-th Zoho lead with a key gets the n-th
+  Supabase lead with it. Only a Supabase lead with both a phone and an
+  email can be reached both ways, so without such leads the matches are
+  the same; with them, a warning is printed.
+- The summary is written after the lists in the JSON file, since counts
+  are only known at the end.
+
+Usage:
+    python scripts/sync/reconcile.py --backfill --out-of-core -o full_history.json
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from scripts.sync.reconcile import MatchResult, SupabaseLead, ZohoLead, _zoho_created_sort_key
+
+
+# Records held in memory per spill before a sorted run is written out
+DEFAULT_RUN_SIZE = 100_000
+
+Row = list
+
+
+class SortedSpill:
+    """Append rows in any order, read them back sorted by key (external merge sort)."""
+
+    def __init__(self, directory: str, name: str, key: Callable[[Row], Any], run_size: int = DEFAULT_RUN_SIZE):
+        self.directory = directory
+        self.name = name
+        self.key = key
+        self.run_size = run_size
+        self.count = 0
+        self._buffer: list[Row] = []
+        self._runs: list[str] = []
+
+    def add(self, row: Row) -> None:
+        self._buffer.append(row)
+        self.count += 1
+        if len(self._buffer) >= self.run_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        self._buffer.sort(key=self.key)
+        path = os.path.join(self.directory, f"{self.name}.{len(self._runs)}.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            for row in self._buffer:
+                f.write(json.dumps(row, ensure_ascii=False))
+                f.write('\n')
+        self._runs.append(path)
+        self._buffer = []
+
+    def __iter__(self) -> Iterator[Row]:
+        """Merge all runs in key order. Can be iterated more than once."""
+        self._flush()
+        return heapq.merge(*(self._read_run(path) for path in self._runs), key=self.key)
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[Row]:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def merge_join(
+    left: Iterable[Row],
+    right: Iterable[Row],
+    left_key: Callable[[Row], Any],
+    right_key: Callable[[Row], Any],
+    on_pair: Callable[[Row, Row], None],
+    on_left: Callable[[Row], None],
+    on_right: Callable[[Row], None],
+) -> None:
+    """
+    Pair two streams sorted by join key in lockstep.
+
+    Rows with equal keys are paired in order (first with first, second with
+    second); surplus rows on either side go to on_left/on_right.
+    """
+    left, right = iter(left), iter(right)
+    lrow, rrow = next(left, None), next(right, None)
+    while lrow is not None and rrow is not None:
+        lkey, rkey = left_key(lrow), right_key(rrow)
+        if lkey < rkey:
+            on_left(lrow)
+            lrow = next(left, None)
+        elif rkey < lkey:
+            on_right(rrow)
+            rrow = next(right, None)
+        else:
+            on_pair(lrow, rrow)
+            lrow, rrow = next(left, None), next(right, None)
+    while lrow is not None:
+        on_left(lrow)
+        lrow = next(left, None)
+    while rrow is not None:
+        on_right(rrow)
+        rrow = next(right, None)
+
+
+# Row layouts. seq is the record's match order: Zoho (created rank, arrival),
+# Supabase arrival index.
+Z_SEQ, Z_ID, Z_NAME, Z_STATUS, Z_PHONE, Z_EMAIL, Z_NOTES, Z_KEY_PHONE, Z_KEY_EMAIL = range(9)
+S_SEQ, S_ID, S_NAME, S_STATUS, S_PHONE, S_EMAIL, S_KEY_PHONE, S_KEY_EMAIL = range(8)
+
+
+def _email_key(email: Optional[str]) -> Optional[str]:
+    key = email.lower().strip() if email else None
+    return key or None
+
+
+def _created_rank(lead: ZohoLead) -> float:
+    """Sort rank putting the newest Created_Time first and unparseable dates last."""
+    created = _zoho_created_sort_key(lead)
+    if created == datetime.min:
+        return float('inf')
+    return -(created - datetime(1970, 1, 1)).total_seconds()
+
+
+def _zoho_row(seq: list, lead: ZohoLead) -> Row:
+    return [seq, lead.id, lead.name, lead.status, lead.phone, lead.email, lead.description,
+            lead.normalized_phone, _email_key(lead.email)]
+
+
+def _supabase_row(seq: int, lead: SupabaseLead) -> Row:
+    return [seq, lead.id, lead.name, lead.status, lead.phone, lead.email,
+            lead.normalized_phone, _email_key(lead.email)]
+
+
+def _unmatched_supabase_row(s: Row) -> Row:
+    return [s[S_SEQ], {'id': s[S_ID], 'name': s[S_NAME], 'phone': s[S_PHONE], 'email': s[S_EMAIL], 'status': s[S_STATUS]}]
+
+
+def _match_row(z: Row, s: Optional[Row], match_type: str, confidence: float) -> Row:
+    match = MatchResult(
+        zoho_id=z[Z_ID],
+        zoho_name=z[Z_NAME],
+        zoho_status=z[Z_STATUS],
+        zoho_phone=z[Z_PHONE],
+        zoho_email=z[Z_EMAIL],
+        zoho_notes=z[Z_NOTES],
+        supabase_id=s[S_ID] if s else None,
+        supabase_name=s[S_NAME] if s else None,
+        supabase_status=s[S_STATUS] if s else None,
+        match_type=match_type,
+        match_confidence=confidence,
+        status_differs=bool(s) and z[Z_STATUS] != s[S_STATUS],
+    )
+    return [z[Z_SEQ], asdict(match)]
+
+
+def reconcile_out_of_core(
+    zoho_leads: Iterable[ZohoLead],
+    supabase_leads: Iterable[SupabaseLead],
+    output_path: str,
+    run_size: int = DEFAULT_RUN_SIZE,
+    spill_dir: Optional[str] = None,
+    sort_zoho_by_created: bool = False,
+) -> dict:
+    """
+    Reconcile two lead streams by phone then email, with bounded memory.
+
+    Args:
+        zoho_leads: Zoho leads in match order (e.g. newest first)
+        supabase_leads: Supabase leads in load order (e.g. iter_supabase_leads)
+        output_path: JSON report path, same layout as save_report
+        run_size: Records buffered per spill before a sorted run is written
+        spill_dir: Directory for temporary run files (default: system temp)
+        sort_zoho_by_created: Match Zoho leads newest Created_Time first
+            instead of arrival order (for unsorted sources like Bulk Read)
+
+    Returns:
+        The report summary (counts and match type breakdown)
+    """
+    with tempfile.TemporaryDirectory(prefix='reconcile-', dir=spill_dir) as directory:
+        def spill(name: str, key: Callable[[Row], Any]) -> SortedSpill:
+            return SortedSpill(directory, name, key, run_size)
+
+        zoho_by_phone = spill('zoho-phone', lambda r: (r[Z_KEY_PHONE], r[Z_SEQ]))
+        zoho_by_email = spill('zoho-email', lambda r: (r[Z_KEY_EMAIL], r[Z_SEQ]))
+        sb_by_phone = spill('sb-phone', lambda r: (r[S_KEY_PHONE], r[S_SEQ]))
+        sb_by_email = spill('sb-email', lambda r: (r[S_KEY_EMAIL], r[S_SEQ]))
+        results = spill('results', lambda r: r[0])
+        sb_left = spill('sb-left', lambda r: r[0])
+
+        def zoho_to_email_stage(z: Row) -> None:
+            if z[Z_KEY_EMAIL]:
+                zoho_by_email.add(z)
+            else:
+                results.add(_match_row(z, None, 'none', 0.0))
+
+        def sb_to_email_stage(s: Row) -> None:
+            if s[S_KEY_EMAIL]:
+                sb_by_email.add(s)
+            else:
+                sb_left.add(_unmatched_supabase_row(s))
+
+        # Spill both sides, routing leads without a phone straight to the email stage
+        print("  Spilling Zoho leads to disk...")
+        for arrival, lead in enumerate(zoho_leads):
+            rank = _created_rank(lead) if sort_zoho_by_created else 0
+            row = _zoho_row([rank, arrival], lead)
+            if row[Z_KEY_PHONE]:
+                zoho_by_phone.add(row)
+            else:
+                zoho_to_email_stage(row)
+        zoho_count = zoho_by_phone.count + zoho_by_email.count + results.count
+
+        print("  Spilling Supabase leads to disk...")
+        supabase_count = 0
+        both_keys = 0
+        for seq, lead in enumerate(supabase_leads):
+            supabase_count += 1
+            row = _supabase_row(seq, lead)
+            if row[S_KEY_PHONE]:
+                both_keys += bool(row[S_KEY_EMAIL])
+                sb_by_phone.add(row)
+            else:
+                sb_to_email_stage(row)
+        if both_keys:
+            print(f"  [WARN] {both_keys} Supabase leads have both a phone and an email. Phone matches are "
+                  f"resolved first here, so matches on them can differ from the in-memory report")
+
+        print("  Merge-joining on phone...")
+        merge_join(
+            zoho_by_phone, sb_by_phone,
+            left_key=lambda r: r[Z_KEY_PHONE],
+            right_key=lambda r: r[S_KEY_PHONE],
+            on_pair=lambda z, s: results.add(_match_row(z, s, 'phone', 1.0)),
+            on_left=zoho_to_email_stage,
+            on_right=sb_to_email_stage,
+        )
+
+        print("  Merge-joining on email...")
+        merge_join(
+            zoho_by_email, sb_by_email,
+            left_key=lambda r: r[Z_KEY_EMAIL],
+            right_key=lambda r: r[S_KEY_EMAIL],
+            on_pair=lambda z, s: results.add(_match_row(z, s, 'email', 0.9)),
+            on_left=lambda z: results.add(_match_row(z, None, 'none', 0.0)),
+            on_right=lambda s: sb_left.add(_unmatched_supabase_row(s)),
+        )
+
+        print(f"  Writing report to {output_path}...")
+        summary = _write_report(output_path, results, sb_left, zoho_count, supabase_count)
+
+    return summary
+
+
+def _write_report(
+    output_path: str,
+    results: SortedSpill,
+    sb_left: SortedSpill,
+    zoho_count: int,
+    supabase_count: int,
+) -> dict:
+    """Stream the report JSON (save_report layout) from the sorted spills."""
+    matched_count = status_diff_count = unmatched_zoho_count = 0
+    match_types: dict[str, int] = {}
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "generated_at": ' + json.dumps(datetime.now().isoformat()) + ',\n')
+
+        f.write('  "matches": [')
+        for i, (_, match) in enumerate(results):
+            f.write((',' if i else '') + '\n    ' + json.dumps(match, ensure_ascii=False))
+            if match['supabase_id']:
+                matched_count += 1
+                match_types[match['match_type']] = match_types.get(match['match_type'], 0) + 1
+            else:
+                unmatched_zoho_count += 1
+            status_diff_count += match['status_differs']
+        f.write('\n  ],\n')
+
+        f.write('  "unmatched_zoho": [')
+        written = 0
+        for _, match in results:
+            if match['match_type'] == 'none':
+                unmatched = {key: match[f'zoho_{key}'] for key in ('id', 'name', 'phone', 'email', 'status')}
+                f.write((',' if written else '') + '\n    ' + json.dumps(unmatched, ensure_ascii=False))
+                written += 1
+        f.write('\n  ],\n')
+
+        f.write('  "unmatched_supabase": [')
+        for i, (_, unmatched) in enumerate(sb_left):
+            f.write((',' if i else '') + '\n    ' + json.dumps(unmatched, ensure_ascii=False))
+        f.write('\n  ],\n')
+
+        summary = {
+            'zoho_lead_count': zoho_count,
+            'supabase_lead_count': supabase_count,
+            'matched_count': matched_count,
+            'unmatched_zoho_count': unmatched_zoho_count,
+            'unmatched_supabase_count': sb_left.count,
+            'status_diff_count': status_diff_count,
+        }
+        f.write('  "summary": ' + json.dumps(summary) + '\n}\n')
+
+    summary['match_types'] = match_types
+    return summary
+
+
+def print_summary(summary: dict) -> None:
+    """Print the out-of-core report summary."""
+    print("\n" + "=" * 60)
+    print("LEAD RECONCILIATION REPORT (out of core)")
+    print("=" * 60)
+    print(f"Zoho leads:           {summary['zoho_lead_count']}")
+    print(f"Supabase leads:       {summary['supabase_lead_count']}")
+    print(f"Matched:              {summary['matched_count']}")
+    print(f"Unmatched (Zoho):     {summary['unmatched_zoho_count']}")
+    print(f"Unmatched (Supabase): {summary['unmatched_supabase_count']}")
+    print(f"Status differences:   {summary['status_diff_count']}")
+    if summary['match_types']:
+        print("\nMATCH TYPE BREAKDOWN")
+        for mtype, count in sorted(summary['match_types'].items(), key=lambda x: -x[1]):
+            print(f"  {mtype}: {count}")
@@ -0,0 +1,135 @@
+"""
+Persisted ledger of settled Zoho -> Supabase lead pairs.
+
+Every matched pair is stored with a content hash of each side (name,
+normalized phone, email). The next reconcile run reuses a pair as is when
+neither hash changed, so only new or changed Zoho leads go through the
+matcher (see Reconciler in reconcile.py).
+
+Status and notes are not hashed: they change all the time and never affect
+which leads pair up.
+
+matched_at is refreshed every time a run confirms a pair. Pairs no run has
+confirmed for LEDGER_MAX_AGE_DAYS (Zoho leads deleted, or only ever outside
+the --days window since) are pruned; they are simply matched afresh if
+their Zoho lead shows up again.
+"""
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+from scripts.sync.phone_normalize import normalize_phone
+
+
+DEFAULT_LEDGER_PATH = Path(__file__).parent / ".match_ledger.sqlite"
+
+# Pairs not confirmed by any run for this long are dropped
+LEDGER_MAX_AGE_DAYS = 90
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS match_ledger (
+    zoho_id TEXT PRIMARY KEY,
+    supabase_id TEXT NOT NULL,
+    match_type TEXT NOT NULL,
+    match_confidence REAL NOT NULL,
+    zoho_hash TEXT NOT NULL,
+    supabase_hash TEXT NOT NULL,
+    matched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_match_ledger_supabase_id ON match_ledger(supabase_id);
+"""
+
+
+def lead_hash(name: Optional[str], phone: Optional[str], email: Optional[str]) -> str:
+    """Hash of the fields matching looks at, normalized the way the matcher compares them."""
+    content = '\x1f'.join((
+        (name or '').strip(),
+        normalize_phone(phone) or '',
+        (email or '').lower().strip(),
+    ))
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """One settled pair."""
+    zoho_id: str
+    supabase_id: str
+    match_type: str
+    match_confidence: float
+    zoho_hash: str
+    supabase_hash: str
+
+
+class MatchLedger:
+    """SQLite-backed store of settled lead pairs, keyed by Zoho ID."""
+
+    def __init__(self, path: Path = DEFAULT_LEDGER_PATH):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "MatchLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def pairs(self) -> dict[str, LedgerEntry]:
+        """Every settled pair, by Zoho ID."""
+        rows = self.conn.execute(
+            "SELECT zoho_id, supabase_id, match_type, match_confidence, zoho_hash, supabase_hash FROM match_ledger"
+        )
+        return {row[0]: LedgerEntry(*row) for row in rows}
+
+    def record(self, entries: Iterable[LedgerEntry]) -> int:
+        """
+        Insert or replace pairs. Returns the number written.
+
+        A Supabase lead belongs to one Zoho lead at a time, so older pairs
+        pointing at the same Supabase lead are dropped.
+        """
+        matched_at = datetime.now().isoformat()
+        rows = [
+            (e.zoho_id, e.supabase_id, e.match_type, e.match_confidence, e.zoho_hash, e.supabase_hash, matched_at)
+            for e in entries
+        ]
+        self.conn.executemany(
+            "DELETE FROM match_ledger WHERE supabase_id = ? AND zoho_id != ?",
+            [(row[1], row[0]) for row in rows],
+        )
+        self.conn.executemany(
+            "INSERT INTO match_ledger "
+            "(zoho_id, supabase_id, match_type, match_confidence, zoho_hash, supabase_hash, matched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(zoho_id) DO UPDATE SET supabase_id = excluded.supabase_id, "
+            "match_type = excluded.match_type, match_confidence = excluded.match_confidence, "
+            "zoho_hash = excluded.zoho_hash, supabase_hash = excluded.supabase_hash, "
+            "matched_at = excluded.matched_at",
+            rows,
+        )
+        self.conn.commit()
+        return len(rows)
+
+    def forget(self, zoho_ids: Iterable[str]) -> int:
+        """Drop pairs for Zoho leads that no longer match anything. Returns the number removed."""
+        cursor = self.conn.executemany("DELETE FROM match_ledger WHERE zoho_id = ?", [(i,) for i in zoho_ids])
+        self.conn.commit()
+        return cursor.rowcount
+
+    def prune(self, max_age_days: int = LEDGER_MAX_AGE_DAYS) -> int:
+        """Drop pairs no run has confirmed for max_age_days. Returns the number removed."""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        cursor = self.conn.execute("DELETE FROM match_ledger WHERE matched_at < ?", (cutoff,))
+        self.conn.commit()
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM match_ledger").fetchone()[0]
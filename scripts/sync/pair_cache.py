@@ -0,0 +1,166 @@
+"""
+On-disk cache of fuzzy name scores between Zoho and Supabase leads.
+
+Keys are content hashes of the two normalized names, so a cached score stays
+valid as long as both names are unchanged, whichever records carry them.
+The value is the bounded_name_ratio() verdict: the score, or NULL for a
+pair below the threshold. Phone and email matches are plain dict lookups
+and are not worth caching.
+
+The cache holds at most max_entries pairs and evicts the least recently
+used Zoho names first. Everything is dropped when the matching fingerprint
+(STATUS_MAP and thresholds, see matching_fingerprint in reconcile.py)
+changes.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_PAIR_CACHE_PATH = Path(__file__).parent / ".pair_cache.sqlite"
+DEFAULT_MAX_ENTRIES = 2_000_000
+
+# Bump when bounded_name_ratio() or the key format changes
+PAIR_CACHE_VERSION = 1
+
+# Zoho names held in memory before new scores are written out
+FLUSH_NAMES = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS name_scores (
+    zoho_key INTEGER NOT NULL,
+    supabase_key INTEGER NOT NULL,
+    score REAL,
+    PRIMARY KEY (zoho_key, supabase_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS zoho_names (
+    zoho_key INTEGER PRIMARY KEY,
+    pairs INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_zoho_names_last_used ON zoho_names(last_used);
+CREATE TABLE IF NOT EXISTS cache_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def content_key(text: str) -> int:
+    """64-bit content hash of a normalized name (signed, to fit SQLite INTEGER)."""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+class PairCache:
+    """SQLite-backed name score cache with LRU eviction by Zoho name."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_PAIR_CACHE_PATH,
+        fingerprint: str = '',
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            path: SQLite file
+            fingerprint: Matching settings the scores depend on; a different
+                value than last time empties the cache
+            max_entries: Max cached pairs kept after each flush
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+
+        fingerprint = f"{PAIR_CACHE_VERSION}:{fingerprint}"
+        if self._get_state('fingerprint') != fingerprint:
+            self.conn.execute("DELETE FROM name_scores")
+            self.conn.execute("DELETE FROM zoho_names")
+            self._set_state('fingerprint', fingerprint)
+
+        # Runs are the LRU clock
+        self.run = int(self._get_state('run') or 0) + 1
+        self._set_state('run', str(self.run))
+        self.conn.commit()
+
+        # zoho_key -> (scores by supabase_key, number already stored)
+        self._open: dict[int, tuple[dict[int, Optional[float]], int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self) -> "PairCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM cache_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO cache_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def scores(self, zoho_name: str) -> dict[int, Optional[float]]:
+        """
+        Cached scores for one normalized Zoho name, by Supabase name key.
+
+        Add newly computed scores to the returned dict; they are written on
+        the next flush.
+        """
+        key = content_key(zoho_name)
+        entry = self._open.get(key)
+        if entry is None:
+            if len(self._open) >= FLUSH_NAMES:
+                self.flush()
+            rows = self.conn.execute("SELECT supabase_key, score FROM name_scores WHERE zoho_key = ?", (key,))
+            scores = dict(rows.fetchall())
+            entry = self._open[key] = (scores, len(scores))
+        return entry[0]
+
+    def flush(self) -> None:
+        """Write new scores, mark the names used this run, then evict down to max_entries."""
+        if not self._open:
+            return
+        for key, (scores, stored) in self._open.items():
+            if len(scores) > stored:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO name_scores (zoho_key, supabase_key, score) VALUES (?, ?, ?)",
+                    [(key, sb_key, score) for sb_key, score in scores.items()],
+                )
+        self.conn.executemany(
+            "INSERT INTO zoho_names (zoho_key, pairs, last_used) VALUES (?, ?, ?) "
+            "ON CONFLICT(zoho_key) DO UPDATE SET pairs = excluded.pairs, last_used = excluded.last_used",
+            [(key, len(scores), self.run) for key, (scores, _) in self._open.items()],
+        )
+        self._open.clear()
+        self._evict()
+        self.conn.commit()
+
+    def _evict(self) -> None:
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return
+        victims = []
+        for key, pairs in self.conn.execute("SELECT zoho_key, pairs FROM zoho_names ORDER BY last_used, zoho_key"):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= pairs
+        self.conn.executemany("DELETE FROM name_scores WHERE zoho_key = ?", victims)
+        self.conn.executemany("DELETE FROM zoho_names WHERE zoho_key = ?", victims)
+
+    def __len__(self) -> int:
+        """Number of cached pairs (as of the last flush)."""
+        return self.conn.execute("SELECT COALESCE(SUM(pairs), 0) FROM zoho_names").fetchone()[0]
@@ -0,0 +1,84 @@
+"""
+Reverse phone index: look up records by any raw phone format.
+
+Every format extract_phone_variants() produces (local, 972, +972, dashed)
+normalizes to the same number, so the index stores one integer key per
+normalized phone rather than one string per variant. Lookups normalize the
+raw input once and are a single dict probe.
+"""
+
+import sys
+from typing import Iterable, Optional
+
+from scripts.sync.phone_normalize import normalize_phone
+
+
+def phone_key(phone: Optional[str]) -> Optional[int]:
+    """
+    Integer key for a phone in any format, or None if it does not normalize.
+
+    The normalized digits are prefixed with 1 so leading zeros (and thus
+    length) survive the conversion: 0501234567 -> 10501234567.
+    """
+    normalized = normalize_phone(phone)
+    return int('1' + normalized) if normalized else None
+
+
+class PhoneIndex:
+    """
+    Maps phones to the records that carry them, in insertion order.
+
+    Records are identified by position (the order they were added) and by
+    id; ids are interned. Most phones belong to one record, so a key maps
+    to a bare position and only shared phones get a list.
+    """
+
+    __slots__ = ('ids', '_positions')
+
+    def __init__(self, records: Iterable[tuple[str, Optional[str]]] = ()):
+        """
+        Args:
+            records: (record_id, raw_phone) pairs; records without a valid
+                phone still take a position so positions line up with the
+                caller's list
+        """
+        self.ids: list[str] = []
+        self._positions: dict[int, object] = {}
+        for record_id, phone in records:
+            self.add(record_id, phone)
+
+    def add(self, record_id: str, phone: Optional[str]) -> int:
+        """Append a record. Returns its position."""
+        position = len(self.ids)
+        self.ids.append(sys.intern(record_id))
+
+        key = phone_key(phone)
+        if key is not None:
+            existing = self._positions.get(key)
+            if existing is None:
+                self._positions[key] = position
+            elif isinstance(existing, list):
+                existing.append(position)
+            else:
+                self._positions[key] = [existing, position]
+        return position
+
+    def positions(self, phone: Optional[str]) -> list[int]:
+        """Positions of records with this phone (any format), in insertion order."""
+        key = phone_key(phone)
+        found = self._positions.get(key) if key is not None else None
+        if found is None:
+            return []
+        return list(found) if isinstance(found, list) else [found]
+
+    def lookup(self, phone: Optional[str]) -> list[str]:
+        """Ids of records with this phone (any format), in insertion order."""
+        return [self.ids[position] for position in self.positions(phone)]
+
+    def __contains__(self, phone: Optional[str]) -> bool:
+        key = phone_key(phone)
+        return key is not None and key in self._positions
+
+    def __len__(self) -> int:
+        """Number of distinct phones indexed."""
+        return len(self._positions)
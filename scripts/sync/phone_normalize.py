@@ -3,12 +3,46 @@ Phone number normalization utility for Israeli phone numbers.
 
 This module normalizes phone numbers to a consistent 10-digit format (05XXXXXXXX)
 to enable accurate matching between Zoho CRM and Supabase.
+
+The same rules are implemented in SQL as public.normalize_il_phone()
+(supabase/migrations/025_normalized_phone.sql), which backs the indexed
+leads.normalized_phone column. Change both together and run
+scripts/sync/phone_parity.py.
 """
 
-import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
+
+
+# Bounded memo for normalize_phone(); the same phones recur across Zoho,
+# Supabase and variant/match helpers within a run
+PHONE_CACHE_SIZE = 1 << 16
+
+# Non-digit ASCII bytes, deleted by bytes.translate in one C-level pass
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+
+def _phone_digits(phone: str) -> str:
+    """ASCII digits of a phone string (non-ASCII characters are dropped)."""
+    return phone.encode('ascii', 'ignore').translate(None, _NON_DIGIT_BYTES).decode('ascii')
+
+
+def _normalize_digits(digits: str) -> Optional[str]:
+    """Apply the Israeli normalization rules to a digits-only string."""
+    # Handle international format (972...)
+    if digits.startswith('972'):
+        digits = '0' + digits[3:]
+
+    # Handle missing leading zero for mobile (5XXXXXXXX)
+    if len(digits) == 9 and digits.startswith('5'):
+        digits = '0' + digits
+
+    # Mobile (05X-XXX-XXXX) and landline (0X-XXX-XXXX) numbers come out
+    # as-is; anything else is kept if long enough that it might still match
+    return digits if len(digits) >= 7 else None
 
 
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
 def normalize_phone(phone: Optional[str]) -> Optional[str]:
     """
     Normalize an Israeli phone number to 10-digit format (05XXXXXXXX).
@@ -29,34 +63,73 @@ def normalize_phone(phone: Optional[str]) -> Optional[str]:
     if not phone:
         return None
 
-    # Remove all non-digit characters
-    digits = re.sub(r'\D', '', phone)
+    # Remove all non-digit characters (ASCII digits only, like the SQL version)
+    digits = _phone_digits(phone)
 
     if not digits:
         return None
 
-    # Handle international format (972...)
-    if digits.startswith('972'):
-        digits = '0' + digits[3:]
+    return _normalize_digits(digits)
 
-    # Handle missing leading zero for mobile (5XXXXXXXX)
-    if len(digits) == 9 and digits.startswith('5'):
-        digits = '0' + digits
 
-    # Validate Israeli mobile format (05X-XXX-XXXX)
-    if len(digits) == 10 and digits.startswith('05'):
-        return digits
+def normalize_phones(phones: Any) -> Any:
+    """
+    Normalize many phone numbers at once.
 
-    # Validate Israeli landline format (0X-XXX-XXXX)
-    if len(digits) == 9 and digits.startswith('0'):
-        return digits
+    Accepts any iterable of strings/None and returns a list, normalizing
+    each distinct value once. pyarrow arrays are normalized entirely with
+    Arrow compute kernels and come back as a pyarrow string array; NumPy
+    arrays go through the same kernels (when pyarrow is installed) and come
+    back as an object array. Results equal normalize_phone() applied
+    element-wise.
 
-    # Also accept 10-digit landlines (02, 03, 04, 08, 09)
-    if len(digits) == 10 and digits.startswith('0'):
-        return digits
+    Args:
+        phones: Iterable, numpy.ndarray, or pyarrow (Chunked)Array of phones
 
-    # Return original digits if we can't normalize (might still match)
-    return digits if len(digits) >= 7 else None
+    Returns:
+        Normalized phones (None where invalid), in the input's container type
+    """
+    module = type(phones).__module__
+    if module.startswith('pyarrow'):
+        return _normalize_phones_arrow(phones)
+    if module.startswith('numpy'):
+        return _normalize_phones_numpy(phones)
+
+    phones = phones if isinstance(phones, list) else list(phones)
+    memo = {phone: _normalize_digits(_phone_digits(phone)) if phone else None for phone in set(phones)}
+    return [memo[phone] for phone in phones]
+
+
+def _normalize_phones_numpy(phones: Any) -> Any:
+    import numpy as np
+
+    values = np.asarray(phones)
+    try:
+        import pyarrow as pa
+    except ImportError:
+        normalized = normalize_phones(values.ravel().tolist())
+    else:
+        normalized = _normalize_phones_arrow(pa.array(values.ravel(), type=pa.string(), from_pandas=True))
+        normalized = normalized.to_numpy(zero_copy_only=False)
+
+    result = np.empty(len(normalized), dtype=object)
+    result[:] = normalized
+    return result.reshape(values.shape)
+
+
+def _normalize_phones_arrow(phones: Any) -> Any:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        raise ImportError("pyarrow not installed. Run: pip install pyarrow")
+
+    digits = pc.replace_substring_regex(phones.cast(pa.string()), pattern='[^0-9]', replacement='')
+    intl = pc.starts_with(digits, '972')
+    digits = pc.if_else(intl, pc.binary_join_element_wise('0', pc.utf8_slice_codeunits(digits, 3), ''), digits)
+    mobile = pc.and_(pc.equal(pc.utf8_length(digits), 9), pc.starts_with(digits, '5'))
+    digits = pc.if_else(mobile, pc.binary_join_element_wise('0', digits, ''), digits)
+    return pc.if_else(pc.greater_equal(pc.utf8_length(digits), 7), digits, pa.scalar(None, pa.string()))
 
 
 def phones_match(phone1: Optional[str], phone2: Optional[str]) -> bool:
@@ -129,6 +202,7 @@ if __name__ == '__main__':
         (None, None),
         ('abc', None),
         ('123', None),
+        ('\u0660\u0665\u0660', None),
     ]
 
     print("Phone Normalization Tests:")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Phone Normalization Parity Check
+
+Verifies that the SQL normalizer (public.normalize_il_phone, migration 025)
+and the Python normalize_phone() agree:
+1. A fixed set of edge cases is sent through the SQL function via RPC
+2. Every lead's stored normalized_phone is compared with normalize_phone(phone)
+
+Usage:
+    python scripts/sync/phone_parity.py --target dev
+    python scripts/sync/phone_parity.py --target prod --cases-only
+
+Exits non-zero if any value differs.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.sync.phone_normalize import normalize_phone
+from scripts.sync.reconcile import SUPABASE_PAGE_SIZE, SUPABASE_SERVICE_KEY, SUPABASE_URL, _supabase_headers
+
+
+PARITY_CASES = [
+    None,
+    '',
+    'abc',
+    '123',
+    '123456',
+    '1234567',
+    '0501234567',
+    '050-123-4567',
+    '050 123 4567',
+    '(050) 123-4567',
+    '501234567',
+    '+972-50-123-4567',
+    '+972501234567',
+    '972501234567',
+    '00972501234567',
+    '972',
+    '9725',
+    '97250123',
+    '+972 3-123-4567',
+    '031234567',
+    '02-1234567',
+    '0771234567',
+    '5',
+    '512345678',
+    '612345678',
+    '+1 (415) 555-0100',
+    '0501234567 / 0527654321',
+    'tel:050.123.4567',
+    '٠٥٠١٢٣٤٥٦٧',  # Arabic-Indic digits
+    'טלפון 050-1234567',  # Hebrew label
+    '０５０１２３４５６７',  # Full-width digits
+]
+
+
+def sql_normalize(phone: Optional[str]) -> Optional[str]:
+    """Run one value through public.normalize_il_phone() via PostgREST RPC."""
+    response = requests.post(
+        f"{SUPABASE_URL}/rest/v1/rpc/normalize_il_phone",
+        headers=_supabase_headers(),
+        json={"phone": phone},
+        timeout=30,
+    )
+    if response.status_code != 200:
+        raise Exception(f"Supabase error: {response.status_code} - {response.text}")
+    return response.json()
+
+
+def check_cases() -> int:
+    """Compare SQL and Python on PARITY_CASES. Returns the number of mismatches."""
+    mismatches = 0
+    for phone in PARITY_CASES:
+        expected = normalize_phone(phone)
+        actual = sql_normalize(phone)
+        if actual != expected:
+            mismatches += 1
+            print(f"  [FAIL] {phone!r}: sql={actual!r} python={expected!r}")
+    print(f"  Cases checked: {len(PARITY_CASES)}, mismatches: {mismatches}")
+    return mismatches
+
+
+def iter_phone_rows(target: str, page_size: int = SUPABASE_PAGE_SIZE) -> Iterator[dict]:
+    """Stream id/phone/normalized_phone for every lead (including deleted), by id keyset."""
+    table = "dev_leads" if target == "dev" else "leads"
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+    headers = {**_supabase_headers(), "Range-Unit": "items", "Range": f"0-{page_size - 1}"}
+
+    last_id = None
+    while True:
+        params = {"select": "id,phone,normalized_phone", "order": "id.asc"}
+        if last_id:
+            params["id"] = f"gt.{last_id}"
+        response = requests.get(url, headers=headers, params=params, timeout=30)
+        if response.status_code not in (200, 206):
+            raise Exception(f"Supabase error: {response.status_code} - {response.text}")
+
+        rows = response.json()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1]["id"]
+
+
+def check_rows(target: str) -> int:
+    """Compare stored normalized_phone with normalize_phone(phone). Returns mismatches."""
+    checked = mismatches = 0
+    for row in iter_phone_rows(target):
+        checked += 1
+        expected = normalize_phone(row.get("phone"))
+        if row.get("normalized_phone") != expected:
+            mismatches += 1
+            if mismatches <= 20:
+                print(f"  [FAIL] {row['id']} {row.get('phone')!r}: "
+                      f"sql={row.get('normalized_phone')!r} python={expected!r}")
+    print(f"  Rows checked: {checked}, mismatches: {mismatches}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check SQL/Python phone normalization parity')
+    parser.add_argument('--target', choices=['dev', 'prod'], default='dev', help='Target database')
+    parser.add_argument('--cases-only', action='store_true', help='Skip the full table comparison')
+    args = parser.parse_args()
+
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        print("[ERROR] Supabase credentials not configured. Check .env.local file.")
+        sys.exit(1)
+
+    print("\nChecking edge cases against normalize_il_phone()...")
+    failures = check_cases()
+
+    if not args.cases_only:
+        print(f"\nChecking stored normalized_phone (target={args.target})...")
+        failures += check_rows(args.target)
+
+    print(f"\n{'[OK] SQL and Python normalizers agree' if not failures else f'[ERROR] {failures} mismatches'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
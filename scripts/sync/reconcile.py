@@ -11,15 +11,30 @@ Matches leads between Zoho CRM and Supabase to identify:
 Usage:
     python scripts/sync/reconcile.py --report-only
     python scripts/sync/reconcile.py --report-only --output report.json
+    python scripts/sync/reconcile.py --report-only --backfill --workers 8
+    python scripts/sync/reconcile.py --backfill --out-of-core -o full_history.json
+    python scripts/sync/reconcile.py --ledger                 # Re-match only new/changed leads, update the ledger
+    python scripts/sync/reconcile.py --report-only --ledger   # Same, but leave the ledger as is
 """
 
 import argparse
+import csv
+import hashlib
+import io
 import json
+import math
 import os
+import queue
 import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 from difflib import SequenceMatcher
 from pathlib import Path
 
@@ -30,6 +45,17 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from scripts.sync.phone_normalize import normalize_phone, phones_match
+from scripts.sync.phone_index import PhoneIndex, phone_key
+from scripts.sync.match_ledger import DEFAULT_LEDGER_PATH, LedgerEntry, MatchLedger, lead_hash
+from scripts.sync.pair_cache import DEFAULT_PAIR_CACHE_PATH, PairCache, content_key
+from scripts.sync.zoho_mirror import DEFAULT_MIRROR_PATH, ZohoMirror
+from scripts.sync.zoho_token_cache import (
+    EXPIRY_MARGIN_SECONDS,
+    credentials_fingerprint,
+    locked_token_cache,
+    read_cached_token,
+    write_cached_token,
+)
 
 
 # ============================================
@@ -64,6 +90,31 @@ ZOHO_REGIONS = {
     "au": "https://www.zohoapis.com.au",
 }
 
+# Zoho caps concurrent API calls per org (10-25 depending on edition);
+# stay well below that so other integrations keep working during a sync
+ZOHO_MAX_CONCURRENCY = 8
+
+# Lead fields read from Zoho (REST pages, Bulk Read and the mirror)
+# Include Mobile field as Zoho often stores phone there
+# Include Description for notes/call logs
+ZOHO_LEAD_FIELDS = [
+    "First_Name", "Last_Name", "Email", "Phone", "Mobile", "Lead_Source", "Lead_Status",
+    "Created_Time", "Modified_Time", "utm_source", "Description",
+]
+
+# Subset of ZOHO_LEAD_FIELDS that zoho_record_to_lead actually reads
+ZOHO_SYNC_FIELDS = [
+    "First_Name", "Last_Name", "Email", "Phone", "Mobile", "Lead_Status", "Created_Time", "Description",
+]
+
+# Zoho's maximum LIMIT for one COQL query
+ZOHO_COQL_PAGE_SIZE = 2000
+
+# Notes/call logs: by far the largest lead field. Lazy-notes runs leave it
+# out of the bulk load and fetch it afterwards by ID, 100 leads per call
+ZOHO_NOTES_FIELD = "Description"
+ZOHO_NOTES_BATCH_SIZE = 100
+
 ZOHO_AUTH_REGIONS = {
     "us": "https://accounts.zoho.com",
     "eu": "https://accounts.zoho.eu",
@@ -71,6 +122,9 @@ ZOHO_AUTH_REGIONS = {
     "au": "https://accounts.zoho.com.au",
 }
 
+# Minimum SequenceMatcher ratio for a fuzzy name match
+NAME_MATCH_THRESHOLD = 0.85
+
 # Status mapping from Zoho Hebrew to English
 # Note: חדש, לקוח, אבוד are mapped to their replacements
 # Removed statuses: contacted, completed, paying_customer (14 canonical statuses)
@@ -108,7 +162,9 @@ STATUS_MAP = {
 }
 
 
-@dataclass
+# Lead and match records are slotted: large backfills hold hundreds of
+# thousands of them, and a per-instance __dict__ roughly doubles their size
+@dataclass(slots=True)
 class ZohoLead:
     """Lead record from Zoho CRM."""
     id: str
@@ -125,7 +181,7 @@ class ZohoLead:
         self.normalized_phone = normalize_phone(self.phone)
 
 
-@dataclass
+@dataclass(slots=True)
 class SupabaseLead:
     """Lead record from Supabase."""
     id: str
@@ -141,7 +197,7 @@ class SupabaseLead:
         self.normalized_phone = normalize_phone(self.phone)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching a Zoho lead to Supabase."""
     zoho_id: str
@@ -179,74 +235,211 @@ class ReconciliationReport:
 
 _zoho_access_token: Optional[str] = None
 _zoho_api_url: Optional[str] = None
+_zoho_token_expires_at: float = 0.0
+_zoho_token_lock = threading.Lock()
 
 
 def get_zoho_access_token() -> tuple[str, str]:
-    """Get a valid Zoho access token, refreshing if needed."""
-    global _zoho_access_token, _zoho_api_url
+    """
+    Get a valid Zoho access token, refreshing if needed.
 
-    if _zoho_access_token and _zoho_api_url:
-        return _zoho_access_token, _zoho_api_url
+    Tokens are shared across processes through the on-disk cache in
+    zoho_token_cache, and only refreshed when close to expiry.
+    """
+    global _zoho_access_token, _zoho_api_url, _zoho_token_expires_at
 
-    if not ZOHO_CLIENT_ID or not ZOHO_CLIENT_SECRET or not ZOHO_REFRESH_TOKEN:
-        raise Exception("Zoho credentials not configured. Check .env file.")
+    with _zoho_token_lock:
+        if _zoho_access_token and _zoho_api_url and time.time() < _zoho_token_expires_at - EXPIRY_MARGIN_SECONDS:
+            return _zoho_access_token, _zoho_api_url
 
-    # Try configured region first, then others
-    regions_to_try = [ZOHO_REGION] if ZOHO_REGION else ["us", "eu", "in", "au"]
+        if not ZOHO_CLIENT_ID or not ZOHO_CLIENT_SECRET or not ZOHO_REFRESH_TOKEN:
+            raise Exception("Zoho credentials not configured. Check .env file.")
 
-    for region in regions_to_try:
-        auth_url = ZOHO_AUTH_REGIONS.get(region, ZOHO_AUTH_REGIONS["us"])
-        api_url = ZOHO_REGIONS.get(region, ZOHO_REGIONS["us"])
+        fingerprint = credentials_fingerprint(ZOHO_CLIENT_ID, ZOHO_REFRESH_TOKEN)
 
-        try:
-            token_url = f"{auth_url}/oauth/v2/token"
-            token_params = {
-                "refresh_token": ZOHO_REFRESH_TOKEN,
-                "client_id": ZOHO_CLIENT_ID,
-                "client_secret": ZOHO_CLIENT_SECRET,
-                "grant_type": "refresh_token"
-            }
-            response = requests.post(token_url, data=token_params, timeout=30)
-            data = response.json()
+        with locked_token_cache() as cache_path:
+            try:
+                cached = read_cached_token(cache_path, fingerprint)
+            except Exception as e:
+                print(f"  [WARN] Could not read Zoho token cache: {e}")
+                cached = None
+            if cached:
+                _zoho_access_token = cached["access_token"]
+                _zoho_api_url = cached["api_url"]
+                _zoho_token_expires_at = cached["expires_at"]
+                print(f"  [OK] Using cached Zoho token ({cached.get('region')} region)")
+                return _zoho_access_token, _zoho_api_url
 
-            if "error" in data:
-                print(f"  [WARN] Region {region} auth failed: {data.get('error')}")
-                continue
+            # Try configured region first, then others
+            regions_to_try = [ZOHO_REGION] if ZOHO_REGION else ["us", "eu", "in", "au"]
+
+            for region in regions_to_try:
+                auth_url = ZOHO_AUTH_REGIONS.get(region, ZOHO_AUTH_REGIONS["us"])
+                api_url = ZOHO_REGIONS.get(region, ZOHO_REGIONS["us"])
+
+                try:
+                    token_url = f"{auth_url}/oauth/v2/token"
+                    token_params = {
+                        "refresh_token": ZOHO_REFRESH_TOKEN,
+                        "client_id": ZOHO_CLIENT_ID,
+                        "client_secret": ZOHO_CLIENT_SECRET,
+                        "grant_type": "refresh_token"
+                    }
+                    response = requests.post(token_url, data=token_params, timeout=30)
+                    data = response.json()
+
+                    if "error" in data:
+                        print(f"  [WARN] Region {region} auth failed: {data.get('error')}")
+                        continue
+
+                    access_token = data.get("access_token")
+                    expires_in = int(data.get("expires_in", 3600))
+                except Exception as e:
+                    print(f"  [WARN] Region {region} failed: {e}")
+                    continue
+
+                if not access_token:
+                    continue
 
-            access_token = data.get("access_token")
-            if access_token:
                 _zoho_access_token = access_token
                 _zoho_api_url = api_url
+                _zoho_token_expires_at = time.time() + expires_in
+                # The token is good either way; a cache failure only costs the next run a refresh
+                try:
+                    _zoho_token_expires_at = write_cached_token(
+                        cache_path, fingerprint, access_token, api_url, region, expires_in=expires_in,
+                    )
+                except Exception as e:
+                    print(f"  [WARN] Could not write Zoho token cache: {e}")
                 print(f"  [OK] Authenticated with Zoho ({region} region)")
                 return access_token, api_url
 
-        except Exception as e:
-            print(f"  [WARN] Region {region} failed: {e}")
-            continue
-
     raise Exception("Failed to authenticate with Zoho CRM. Check credentials.")
 
 
-def fetch_zoho_leads_page(page: int = 1, per_page: int = 200) -> dict:
-    """Fetch a page of leads from Zoho CRM."""
+def fetch_zoho_leads_page(
+    page: int = 1,
+    per_page: int = 200,
+    modified_since: Optional[str] = None,
+    sort_by: str = "Created_Time",
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """
+    Fetch a page of leads from Zoho CRM.
+
+    Args:
+        page: 1-based page number
+        per_page: Records per page (Zoho max 200)
+        modified_since: ISO datetime; only leads modified after it are returned
+        sort_by: Zoho sort field (Created_Time or Modified_Time), always desc
+        fields: Fields to request (default ZOHO_LEAD_FIELDS)
+    """
     access_token, api_url = get_zoho_access_token()
 
     url = f"{api_url}/crm/v6/Leads"
     headers = {"Authorization": f"Zoho-oauthtoken {access_token}"}
+    if modified_since:
+        headers["If-Modified-Since"] = modified_since
     params = {
-        # Include Mobile field as Zoho often stores phone there
-        # Include Description for notes/call logs
-        "fields": "First_Name,Last_Name,Email,Phone,Mobile,Lead_Source,Lead_Status,Created_Time,utm_source,Description",
+        "fields": ",".join(fields or ZOHO_LEAD_FIELDS),
         "page": page,
         "per_page": per_page,
-        "sort_by": "Created_Time",
+        "sort_by": sort_by,
         "sort_order": "desc",
     }
 
     response = requests.get(url, headers=headers, params=params, timeout=30)
+    # 204 = no records, 304 = nothing modified since If-Modified-Since
+    if response.status_code in (204, 304):
+        return {"data": [], "info": {"more_records": False}}
+    return response.json()
+
+
+def fetch_zoho_leads_coql(
+    cutoff: str,
+    after: Optional[tuple[str, str]] = None,
+    limit: int = ZOHO_COQL_PAGE_SIZE,
+    fields: Optional[list[str]] = None,
+) -> dict:
+    """
+    Fetch one keyset page of leads created since `cutoff` with a COQL query.
+
+    Zoho filters and projects server-side, so only ZOHO_SYNC_FIELDS of leads
+    inside the window are transferred.
+
+    Args:
+        cutoff: ISO datetime with offset; only leads created at/after it are returned
+        after: (Created_Time, id) of the last lead already read, for keyset paging
+        limit: Page size (Zoho max 2000)
+        fields: Fields to select (default ZOHO_SYNC_FIELDS)
+    """
+    access_token, api_url = get_zoho_access_token()
+
+    where = f"Created_Time >= '{cutoff}'"
+    if after:
+        created, lead_id = after
+        where += f" and (Created_Time < '{created}' or (Created_Time = '{created}' and id < {int(lead_id)}))"
+
+    select_query = (
+        f"select {', '.join(fields or ZOHO_SYNC_FIELDS)}, id from Leads "
+        f"where {where} order by Created_Time desc, id desc limit {limit}"
+    )
+
+    response = requests.post(
+        f"{api_url}/crm/v6/coql",
+        headers={"Authorization": f"Zoho-oauthtoken {access_token}"},
+        json={"select_query": select_query},
+        timeout=30,
+    )
+    if response.status_code == 204:
+        return {"data": [], "info": {"more_records": False}}
+    return response.json()
+
+
+def fetch_deleted_zoho_leads_page(page: int = 1, modified_since: Optional[str] = None) -> dict:
+    """Fetch a page of leads deleted in Zoho CRM (recycle bin and permanent)."""
+    access_token, api_url = get_zoho_access_token()
+
+    url = f"{api_url}/crm/v6/Leads/deleted"
+    headers = {"Authorization": f"Zoho-oauthtoken {access_token}"}
+    if modified_since:
+        headers["If-Modified-Since"] = modified_since
+    params = {"type": "all", "page": page, "per_page": 200}
+
+    response = requests.get(url, headers=headers, params=params, timeout=30)
+    if response.status_code in (204, 304):
+        return {"data": [], "info": {"more_records": False}}
     return response.json()
 
 
+def fetch_zoho_notes_batch(zoho_ids: list[str]) -> dict[str, Optional[str]]:
+    """
+    Fetch the notes field for up to ZOHO_NOTES_BATCH_SIZE leads in one call.
+
+    Returns:
+        Dict of Zoho lead ID -> notes (None when empty)
+    """
+    access_token, api_url = get_zoho_access_token()
+
+    response = requests.get(
+        f"{api_url}/crm/v6/Leads",
+        headers={"Authorization": f"Zoho-oauthtoken {access_token}"},
+        params={"ids": ",".join(zoho_ids), "fields": ZOHO_NOTES_FIELD},
+        timeout=30,
+    )
+    if response.status_code == 204:
+        return {}
+    data = response.json()
+    if "data" not in data:
+        raise Exception(f"Zoho API error: {data.get('message', data.get('code'))}")
+    return {record["id"]: record.get(ZOHO_NOTES_FIELD) for record in data["data"] if record.get("id")}
+
+
+def without_notes(fields: list[str]) -> list[str]:
+    """A Zoho field list minus the notes field."""
+    return [field for field in fields if field != ZOHO_NOTES_FIELD]
+
+
 def normalize_zoho_status(status_raw: str) -> str:
     """Normalize a Zoho status (Hebrew) to English key."""
     if not status_raw:
@@ -254,98 +447,661 @@ def normalize_zoho_status(status_raw: str) -> str:
     return STATUS_MAP.get(status_raw.strip(), status_raw.strip().lower().replace(" ", "_"))
 
 
-def load_zoho_leads(days_back: int = 30) -> list[ZohoLead]:
+def zoho_record_to_lead(record: dict) -> ZohoLead:
+    """Build a ZohoLead from a Zoho Leads API record."""
+    first_name = record.get("First_Name", "") or ""
+    last_name = record.get("Last_Name", "") or ""
+    name = f"{first_name} {last_name}".strip() or "Unknown"
+
+    status_raw = record.get("Lead_Status", "") or ""
+    status = normalize_zoho_status(status_raw)
+
+    # Try Phone first, fall back to Mobile
+    phone = record.get("Phone") or record.get("Mobile")
+
+    return ZohoLead(
+        id=record.get("id", ""),
+        name=name,
+        email=record.get("Email"),
+        phone=phone,
+        status=status,
+        status_raw=status_raw,
+        created_at=record.get("Created_Time", ""),
+        description=record.get("Description"),
+    )
+
+
+def split_at_cutoff(records: list[dict], cutoff_date: datetime) -> tuple[list[dict], bool]:
     """
-    Load leads from Zoho CRM.
+    Keep the leading records of a desc-sorted page created on/after the cutoff.
+
+    Returns:
+        Tuple of (records newer than the cutoff, whether the cutoff was reached)
+    """
+    for i, record in enumerate(records):
+        created_str = record.get("Created_Time", "")
+        try:
+            # Parse Zoho datetime format
+            created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+            if created.replace(tzinfo=None) < cutoff_date:
+                # Leads are sorted desc, so we can stop when we're past the cutoff
+                return records[:i], True
+        except Exception:
+            pass
+
+    return records, False
+
+
+def parse_zoho_page(records: list[dict], cutoff_date: datetime) -> tuple[list[ZohoLead], bool]:
+    """
+    Convert one desc-sorted page of Zoho records, stopping at the cutoff.
+
+    Returns:
+        Tuple of (leads newer than the cutoff, whether the cutoff was reached)
+    """
+    kept, reached_cutoff = split_at_cutoff(records, cutoff_date)
+    return [zoho_record_to_lead(record) for record in kept], reached_cutoff
+
+
+def iter_zoho_pages(
+    max_pages: int = 50,
+    concurrency: int = 1,
+    fetch_page=None,
+    **params,
+) -> Iterator[tuple[int, dict]]:
+    """
+    Yield (page, response) for Zoho lead pages in page order.
+
+    With concurrency > 1, up to that many page requests are kept in flight
+    on a thread pool. Results are still yielded in page order, and closing
+    the generator cancels every request that has not started yet. Extra
+    keyword arguments are passed to fetch_page (default fetch_zoho_leads_page).
+    """
+    fetch_page = fetch_page or fetch_zoho_leads_page
+
+    if concurrency <= 1:
+        for page in range(1, max_pages + 1):
+            yield page, fetch_page(page=page, **params)
+        return
+
+    concurrency = min(concurrency, ZOHO_MAX_CONCURRENCY)
+    # Authenticate once up front so the worker threads share one token
+    get_zoho_access_token()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        in_flight: deque = deque()
+        next_page = 1
+        while in_flight or next_page <= max_pages:
+            while next_page <= max_pages and len(in_flight) < concurrency:
+                in_flight.append((next_page, executor.submit(fetch_page, page=next_page, **params)))
+                next_page += 1
+            page, future = in_flight.popleft()
+            yield page, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_zoho_records(pages: Iterator[tuple[int, dict]]) -> Iterator[list[dict]]:
+    """Yield the record list of each page until Zoho reports no more records."""
+    try:
+        for page, response in pages:
+            if "data" not in response:
+                if "code" in response:
+                    raise Exception(f"Zoho API error: {response.get('message', response.get('code'))}")
+                return
+            if response["data"]:
+                yield response["data"]
+            if not response.get("info", {}).get("more_records"):
+                return
+    finally:
+        pages.close()
+
+
+def refresh_zoho_mirror(mirror, cutoff_date: datetime, concurrency: int = 1, max_pages: int = 50) -> None:
+    """
+    Bring a ZohoMirror up to date for leads created since cutoff_date.
+
+    The first run (or a wider window than before) loads the whole window.
+    Later runs only fetch leads modified since the previous refresh
+    (If-Modified-Since) and drop leads deleted in Zoho since then. If
+    max_pages runs out before Zoho does, synced_at is left as it was, so
+    the changes beyond the last page are fetched again next run.
+    """
+    from datetime import timedelta
+
+    # Overlap with the previous refresh so clock skew can't lose an edit;
+    # re-fetched records are simply upserted again
+    started_at = (datetime.now().astimezone() - timedelta(minutes=5)).isoformat(timespec="seconds")
+    synced_at = mirror.get_state("synced_at")
+    covered_since = mirror.get_state("covered_since")
+
+    if synced_at is None or covered_since is None or cutoff_date < datetime.fromisoformat(covered_since):
+        print("  Mirror does not cover this window, loading it from Zoho...")
+        # A reload only upserts the window: leads deleted since the last
+        # refresh would otherwise stay in the mirror for good
+        removed, swept = _sweep_deleted_zoho_leads(mirror, synced_at, max_pages) if synced_at is not None else (0, True)
+
+        written = 0
+        covered = False
+        pages = iter_zoho_pages(max_pages=max_pages, concurrency=concurrency)
+        try:
+            for page, response in pages:
+                if "data" not in response:
+                    if "code" in response:
+                        raise Exception(f"Zoho API error: {response.get('message', response.get('code'))}")
+                    covered = True
+                    break
+                kept, reached_cutoff = split_at_cutoff(response["data"], cutoff_date)
+                written += mirror.upsert(kept)
+                if reached_cutoff or not response.get("info", {}).get("more_records"):
+                    covered = True
+                    break
+        finally:
+            pages.close()
+
+        if covered:
+            mirror.set_state("covered_since", cutoff_date.isoformat())
+            print(f"  Mirrored {written} Zoho leads ({removed} deleted)")
+        else:
+            # Hit max_pages before the cutoff: the next run has to load the window again
+            print(f"  [WARN] Mirrored {written} Zoho leads, but stopped after {max_pages} pages "
+                  f"before reaching the cutoff")
+        if not swept:
+            print(f"  [WARN] More than {max_pages} pages of deleted leads, the rest are swept next run")
+            return
+    else:
+        print(f"  Refreshing mirror with leads modified since {synced_at}...")
+        changed: list[dict] = []
+        pages = iter_zoho_pages(
+            max_pages=max_pages, concurrency=concurrency,
+            modified_since=synced_at, sort_by="Modified_Time",
+        )
+        fetched = _read_zoho_pages(pages, changed.extend)
+        written = mirror.upsert(changed)
+
+        removed, swept = _sweep_deleted_zoho_leads(mirror, synced_at, max_pages)
+        print(f"  Mirror refreshed: {written} changed, {removed} deleted")
+        if not (fetched and swept):
+            # Leads past the last page would never be fetched again once
+            # synced_at moves on; a reload of the window picks them all up
+            print(f"  [WARN] Stopped after {max_pages} pages of changes, the window is reloaded next run")
+            mirror.clear_state("covered_since")
+            return
+
+    mirror.set_state("synced_at", started_at)
+
+
+def _read_zoho_pages(pages: Iterator[tuple[int, dict]], handle_records: Callable[[list[dict]], object]) -> bool:
+    """
+    Pass each page's records to handle_records until Zoho reports no more records.
+
+    Returns:
+        False if the pages ran out first (max_pages reached, more records left in Zoho)
+    """
+    try:
+        for page, response in pages:
+            if "data" not in response:
+                if "code" in response:
+                    raise Exception(f"Zoho API error: {response.get('message', response.get('code'))}")
+                return True
+            if response["data"]:
+                handle_records(response["data"])
+            if not response.get("info", {}).get("more_records"):
+                return True
+        return False
+    finally:
+        pages.close()
+
+
+def _sweep_deleted_zoho_leads(mirror, since: str, max_pages: int) -> tuple[int, bool]:
+    """
+    Drop leads deleted in Zoho since the given time from the mirror.
+
+    Returns:
+        (number removed, whether every page of deleted leads was read)
+    """
+    deleted_ids: list[str] = []
+    pages = iter_zoho_pages(max_pages=max_pages, fetch_page=fetch_deleted_zoho_leads_page, modified_since=since)
+    swept = _read_zoho_pages(
+        pages, lambda records: deleted_ids.extend(record["id"] for record in records if record.get("id"))
+    )
+    return mirror.delete(deleted_ids), swept
+
+
+def create_zoho_bulk_read_job(
+    criteria: Optional[dict] = None,
+    page: int = 1,
+    fields: Optional[list[str]] = None,
+) -> str:
+    """Create a Zoho Bulk Read job exporting lead fields as CSV. Returns the job ID."""
+    access_token, api_url = get_zoho_access_token()
+
+    query: dict = {
+        "module": {"api_name": "Leads"},
+        # Bulk Read exports the record ID as its own "Id" column
+        "fields": fields or ZOHO_LEAD_FIELDS,
+        "page": page,
+    }
+    if criteria:
+        query["criteria"] = criteria
+
+    response = requests.post(
+        f"{api_url}/crm/bulk/v6/read",
+        headers={"Authorization": f"Zoho-oauthtoken {access_token}"},
+        json={"query": query, "file_type": "csv"},
+        timeout=30,
+    )
+    data = response.json()
+    try:
+        return data["data"][0]["details"]["id"]
+    except (KeyError, IndexError, TypeError):
+        raise Exception(f"Failed to create Zoho bulk read job: {data}")
+
+
+def wait_for_zoho_bulk_read_job(job_id: str, poll_interval: float = 5.0, timeout: float = 1800.0) -> dict:
+    """
+    Poll a Bulk Read job until it completes.
+
+    Returns:
+        The job's "result" object (download_url, count, more_records, page)
+    """
+    deadline = time.time() + timeout
+    while True:
+        access_token, api_url = get_zoho_access_token()
+        response = requests.get(
+            f"{api_url}/crm/bulk/v6/read/{job_id}",
+            headers={"Authorization": f"Zoho-oauthtoken {access_token}"},
+            timeout=30,
+        )
+        job = response.json().get("data", [{}])[0]
+        state = job.get("state")
+
+        if state == "COMPLETED":
+            return job.get("result", {})
+        if state == "FAILED":
+            raise Exception(f"Zoho bulk read job {job_id} failed: {job}")
+        if time.time() > deadline:
+            raise Exception(f"Zoho bulk read job {job_id} did not finish in {timeout:.0f}s (state: {state})")
+
+        print(f"    Bulk read job {job_id}: {state}...")
+        time.sleep(poll_interval)
+
+
+def _iter_zoho_bulk_csv(download_url: str) -> Iterator[dict]:
+    """Download a Bulk Read result zip and stream its CSV rows as Zoho-style records."""
+    access_token, api_url = get_zoho_access_token()
+    url = download_url if download_url.startswith("http") else f"{api_url}{download_url}"
+
+    # zipfile needs a seekable file; spool the download to disk, not memory
+    with tempfile.TemporaryFile() as tmp:
+        with requests.get(url, headers={"Authorization": f"Zoho-oauthtoken {access_token}"}, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                tmp.write(chunk)
+        tmp.seek(0)
+
+        with zipfile.ZipFile(tmp) as archive:
+            for member in archive.namelist():
+                if not member.endswith(".csv"):
+                    continue
+                with archive.open(member) as raw:
+                    for row in csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")):
+                        # Match the REST shape: lower-case "id" and None for empty cells
+                        record = {key: (value if value != "" else None) for key, value in row.items()}
+                        record["id"] = record.pop("Id", None) or ""
+                        yield record
+
+
+def iter_zoho_leads_bulk(
+    cutoff_date: Optional[datetime] = None,
+    fields: Optional[list[str]] = None,
+) -> Iterator[ZohoLead]:
+    """
+    Stream leads from Zoho's Bulk Read API (for historical backfills).
+
+    Creates one export job per 200k-record page, waits for it, then streams
+    the zipped CSV row by row into ZohoLead objects. Rows come in Zoho's
+    export order, not sorted by Created_Time.
 
     Args:
-        days_back: Number of days back to fetch leads
+        cutoff_date: Only export leads created on/after this local time (None = full history)
+        fields: Fields to export (default ZOHO_LEAD_FIELDS)
+    """
+    criteria = None
+    if cutoff_date is not None:
+        criteria = {
+            "field": {"api_name": "Created_Time"},
+            "comparator": "greater_equal",
+            "value": cutoff_date.astimezone().isoformat(timespec="seconds"),
+        }
+
+    page = 1
+    while True:
+        job_id = create_zoho_bulk_read_job(criteria=criteria, page=page, fields=fields)
+        print(f"  Bulk read job {job_id} created (page {page})")
+        result = wait_for_zoho_bulk_read_job(job_id)
+
+        if result.get("download_url"):
+            for record in _iter_zoho_bulk_csv(result["download_url"]):
+                yield zoho_record_to_lead(record)
+
+        if not result.get("more_records"):
+            return
+        page += 1
+
+
+def load_zoho_leads_coql(
+    cutoff_date: datetime,
+    max_pages: int = 500,
+    fields: Optional[list[str]] = None,
+) -> list[ZohoLead]:
+    """
+    Load leads created since cutoff_date with keyset-paged COQL queries.
 
     Returns:
-        List of ZohoLead objects
+        List of ZohoLead objects, newest first
+    """
+    from datetime import timedelta
+
+    # The paged loader compares Zoho's wall-clock Created_Time with a naive
+    # local cutoff. COQL needs an offset-aware literal, so widen the server
+    # filter by the largest possible UTC offset gap and trim exactly below
+    cutoff = (cutoff_date - timedelta(hours=14)).astimezone().isoformat(timespec="seconds")
+    all_leads: list[ZohoLead] = []
+    after: Optional[tuple[str, str]] = None
+
+    for page in range(1, max_pages + 1):
+        response = fetch_zoho_leads_coql(cutoff, after=after, fields=fields)
+        if "data" not in response:
+            if "code" in response:
+                print(f"  [ERROR] Zoho COQL error: {response.get('message', response.get('code'))}")
+            break
+
+        records = response["data"]
+        if not records:
+            break
+
+        kept, reached_cutoff = split_at_cutoff(records, cutoff_date)
+        all_leads.extend(zoho_record_to_lead(record) for record in kept)
+
+        if reached_cutoff or not response.get("info", {}).get("more_records"):
+            break
+        after = (records[-1]["Created_Time"], records[-1]["id"])
+        print(f"  Fetched COQL page {page}, total: {len(all_leads)} leads")
+
+    print(f"  Total Zoho leads loaded (COQL): {len(all_leads)}")
+    return all_leads
+
+
+def _zoho_created_sort_key(lead: ZohoLead) -> datetime:
+    try:
+        return datetime.fromisoformat(lead.created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+    except Exception:
+        return datetime.min
+
+
+def load_zoho_leads_bulk(
+    cutoff_date: Optional[datetime] = None,
+    fields: Optional[list[str]] = None,
+) -> list[ZohoLead]:
+    """Load leads via Bulk Read, sorted newest first like the paged loader."""
+    leads = list(iter_zoho_leads_bulk(cutoff_date, fields=fields))
+    leads.sort(key=_zoho_created_sort_key, reverse=True)
+    print(f"  Total Zoho leads loaded (bulk read): {len(leads)}")
+    return leads
+
+
+def iter_zoho_lead_batches(
+    days_back: int = 30,
+    concurrency: int = 1,
+    mirror_path: Optional[Path] = None,
+    backfill: bool = False,
+    use_coql: bool = False,
+    lazy_notes: bool = False,
+) -> Iterator[list[ZohoLead]]:
+    """
+    Load leads from Zoho CRM as a stream of batches, newest first.
+
+    Paged REST loads yield one batch per page as it arrives; the mirror,
+    COQL and Bulk Read loaders yield their whole result as one batch.
+    Arguments are as for load_zoho_leads.
     """
     from datetime import timedelta
 
+    if backfill:
+        print("  Fetching full Zoho lead history (bulk read)...")
+        yield load_zoho_leads_bulk(fields=without_notes(ZOHO_LEAD_FIELDS) if lazy_notes else None)
+        return
+
     print(f"  Fetching Zoho leads (last {days_back} days)...")
 
     cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days_back)
 
-    all_leads = []
-    page = 1
-    max_pages = 50  # Safety limit
+    if use_coql:
+        yield load_zoho_leads_coql(cutoff_date, fields=without_notes(ZOHO_SYNC_FIELDS) if lazy_notes else None)
+        return
 
-    while page <= max_pages:
-        try:
-            response = fetch_zoho_leads_page(page=page)
+    if mirror_path is not None:
+        # The mirror always stores notes, so later runs can still read them
+        with ZohoMirror(mirror_path) as mirror:
+            refresh_zoho_mirror(mirror, cutoff_date, concurrency=concurrency)
+            records, _ = split_at_cutoff(mirror.records(), cutoff_date)
+        all_leads = [zoho_record_to_lead(record) for record in records]
+        if lazy_notes:
+            for lead in all_leads:
+                lead.description = None
+        print(f"  Total Zoho leads loaded from mirror: {len(all_leads)}")
+        yield all_leads
+        return
+
+    total = 0
+    max_pages = 50  # Safety limit
+    page = 0
 
+    fields = without_notes(ZOHO_LEAD_FIELDS) if lazy_notes else None
+    pages = iter_zoho_pages(max_pages=max_pages, concurrency=concurrency, fields=fields)
+    try:
+        for page, response in pages:
             if "data" not in response:
                 if "code" in response:
                     print(f"  [ERROR] Zoho API error: {response.get('message', response.get('code'))}")
                 break
 
-            leads = response["data"]
-            if not leads:
+            records = response["data"]
+            if not records:
                 break
 
-            for lead in leads:
-                created_str = lead.get("Created_Time", "")
-                try:
-                    # Parse Zoho datetime format
-                    created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                    if created.replace(tzinfo=None) < cutoff_date:
-                        # Leads are sorted desc, so we can stop when we're past the cutoff
-                        print(f"  Reached cutoff date, stopping at page {page}")
-                        break
-                except Exception:
-                    pass
-
-                first_name = lead.get("First_Name", "") or ""
-                last_name = lead.get("Last_Name", "") or ""
-                name = f"{first_name} {last_name}".strip() or "Unknown"
-
-                status_raw = lead.get("Lead_Status", "") or ""
-                status = normalize_zoho_status(status_raw)
-
-                # Try Phone first, fall back to Mobile
-                phone = lead.get("Phone") or lead.get("Mobile")
-
-                all_leads.append(ZohoLead(
-                    id=lead.get("id", ""),
-                    name=name,
-                    email=lead.get("Email"),
-                    phone=phone,
-                    status=status,
-                    status_raw=status_raw,
-                    created_at=created_str,
-                    description=lead.get("Description"),
-                ))
+            page_leads, reached_cutoff = parse_zoho_page(records, cutoff_date)
+            total += len(page_leads)
+            if page_leads:
+                yield page_leads
+
+            if reached_cutoff:
+                print(f"  Reached cutoff date, stopping at page {page}")
+                break
 
             # Check if there's more data
             info = response.get("info", {})
             if not info.get("more_records"):
                 break
 
-            page += 1
-            print(f"  Fetched page {page - 1}, total: {len(all_leads)} leads")
+            print(f"  Fetched page {page}, total: {total} leads")
 
-        except Exception as e:
-            print(f"  [ERROR] Fetching page {page}: {e}")
-            break
+    except Exception as e:
+        print(f"  [ERROR] Fetching page {page + 1}: {e}")
+    finally:
+        pages.close()
+
+    print(f"  Total Zoho leads loaded: {total}")
+
+
+def load_zoho_leads(
+    days_back: int = 30,
+    concurrency: int = 1,
+    mirror_path: Optional[Path] = None,
+    backfill: bool = False,
+    use_coql: bool = False,
+    lazy_notes: bool = False,
+) -> list[ZohoLead]:
+    """
+    Load leads from Zoho CRM.
 
-    print(f"  Total Zoho leads loaded: {len(all_leads)}")
+    Args:
+        days_back: Number of days back to fetch leads
+        concurrency: Page requests kept in flight at once (1 = sequential)
+        mirror_path: Serve leads from this local ZohoMirror after a delta refresh
+        backfill: Export the full lead history with Bulk Read (ignores days_back)
+        use_coql: Filter the window server-side with COQL instead of paging all leads
+        lazy_notes: Leave out notes (description=None); fetch them later with load_zoho_notes
+
+    Returns:
+        List of ZohoLead objects, newest first
+    """
+    all_leads: list[ZohoLead] = []
+    for batch in iter_zoho_lead_batches(days_back, concurrency, mirror_path, backfill, use_coql, lazy_notes):
+        all_leads.extend(batch)
     return all_leads
 
 
+def load_zoho_notes(zoho_ids: list[str], mirror_path: Optional[Path] = None) -> dict[str, Optional[str]]:
+    """
+    Fetch notes for specific Zoho leads (the second half of a lazy-notes load).
+
+    Args:
+        zoho_ids: Zoho lead IDs to fetch notes for
+        mirror_path: Read notes from this ZohoMirror instead of the API
+
+    Returns:
+        Dict of Zoho lead ID -> notes (None when empty)
+    """
+    zoho_ids = list(dict.fromkeys(zoho_ids))
+    if not zoho_ids:
+        return {}
+
+    if mirror_path is not None:
+        with ZohoMirror(mirror_path) as mirror:
+            records = mirror.records_by_id(zoho_ids)
+        return {zoho_id: record.get(ZOHO_NOTES_FIELD) for zoho_id, record in records.items()}
+
+    notes: dict[str, Optional[str]] = {}
+    for i in range(0, len(zoho_ids), ZOHO_NOTES_BATCH_SIZE):
+        notes.update(fetch_zoho_notes_batch(zoho_ids[i:i + ZOHO_NOTES_BATCH_SIZE]))
+    print(f"  Fetched notes for {len(notes)} Zoho leads")
+    return notes
+
+
 # ============================================
 # Supabase Data Loader
 # ============================================
 
-def load_supabase_leads(target: str = 'dev') -> list[SupabaseLead]:
+# Rows per keyset page; PostgREST's max-rows may cap it lower, which is
+# harmless because paging continues until an empty page
+SUPABASE_PAGE_SIZE = 1000
+
+SUPABASE_LEAD_COLUMNS = "id,name,email,phone,status,created_at,custom_fields"
+
+
+def _supabase_headers() -> dict:
+    return {
+        "apikey": SUPABASE_SERVICE_KEY,
+        "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+        "Content-Type": "application/json",
+    }
+
+
+def _supabase_row_to_lead(row: dict) -> SupabaseLead:
+    return SupabaseLead(
+        id=row.get("id", ""),
+        name=row.get("name", ""),
+        email=row.get("email"),
+        phone=row.get("phone"),
+        status=row.get("status", "new"),
+        created_at=row.get("created_at", ""),
+        custom_fields=row.get("custom_fields"),
+    )
+
+
+def count_supabase_leads(target: str = 'dev') -> Optional[int]:
+    """Exact number of non-deleted leads, from PostgREST's Content-Range header."""
+    table = "dev_leads" if target == "dev" else "leads"
+    response = requests.head(
+        f"{SUPABASE_URL}/rest/v1/{table}",
+        headers={**_supabase_headers(), "Prefer": "count=exact", "Range-Unit": "items", "Range": "0-0"},
+        params={"select": "id", "deleted_at": "is.null"},
+        timeout=30,
+    )
+    # Content-Range: 0-0/12345 (or */0 for an empty table)
+    content_range = response.headers.get("Content-Range", "")
+    total = content_range.rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def iter_supabase_leads(
+    target: str = 'dev',
+    page_size: int = SUPABASE_PAGE_SIZE,
+    columns: str = SUPABASE_LEAD_COLUMNS,
+) -> Iterator[SupabaseLead]:
+    """
+    Stream non-deleted Supabase leads, newest first, with bounded memory.
+
+    Pages by (created_at, id) keyset using Range headers, so it never hits
+    PostgREST's max-rows truncation and only one page is held at a time.
+    Order matches the old single GET (created_at desc, NULLs first), with
+    id desc breaking ties.
+
+    Args:
+        target: 'dev' for dev_leads table, 'prod' for leads table
+        page_size: Rows requested per page
+        columns: PostgREST select list
+    """
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise Exception("Supabase credentials not configured. Check .env.local file.")
+
+    table = "dev_leads" if target == "dev" else "leads"
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+    headers = {**_supabase_headers(), "Range-Unit": "items", "Range": f"0-{page_size - 1}"}
+
+    # Postgres sorts NULL created_at first in DESC order: page those by id,
+    # then the dated rows by (created_at, id)
+    for null_phase in (True, False):
+        last: Optional[dict] = None
+        while True:
+            params = {
+                "select": columns,
+                "deleted_at": "is.null",
+                "order": "id.desc" if null_phase else "created_at.desc,id.desc",
+            }
+            if null_phase:
+                params["created_at"] = "is.null"
+                if last:
+                    params["id"] = f"lt.{last['id']}"
+            else:
+                params["created_at"] = "not.is.null"
+                if last:
+                    created, lead_id = last["created_at"], last["id"]
+                    params["or"] = f'(created_at.lt."{created}",and(created_at.eq."{created}",id.lt.{lead_id}))'
+
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+            if response.status_code not in (200, 206):
+                raise Exception(f"Supabase error: {response.status_code} - {response.text}")
+
+            rows = response.json()
+            if not rows:
+                break
+            for row in rows:
+                yield _supabase_row_to_lead(row)
+            last = rows[-1]
+
+
+def load_supabase_leads(target: str = 'dev', raise_errors: bool = False) -> list[SupabaseLead]:
     """
     Load leads from Supabase.
 
     Args:
         target: 'dev' for dev_leads table, 'prod' for leads table
+        raise_errors: Raise on a failed request instead of printing it and
+            returning [] (stream_reconciliation needs the error to stop the Zoho download)
 
     Returns:
         List of SupabaseLead objects
@@ -356,64 +1112,458 @@ def load_supabase_leads(target: str = 'dev') -> list[SupabaseLead]:
     table = "dev_leads" if target == "dev" else "leads"
     print(f"  Fetching from Supabase table: {table}...")
 
-    url = f"{SUPABASE_URL}/rest/v1/{table}"
-    headers = {
-        "apikey": SUPABASE_SERVICE_KEY,
-        "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
-        "Content-Type": "application/json",
-    }
-    params = {
-        "select": "id,name,email,phone,status,created_at,custom_fields",
-        "deleted_at": "is.null",
-        "order": "created_at.desc",
-    }
-
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    total = count_supabase_leads(target)
+    if total is not None:
+        print(f"  Supabase reports {total} leads")
 
-    if response.status_code != 200:
-        print(f"  [ERROR] Supabase error: {response.status_code} - {response.text}")
+    try:
+        leads = list(iter_supabase_leads(target))
+    except Exception as e:
+        if raise_errors:
+            raise
+        print(f"  [ERROR] {e}")
         return []
 
-    data = response.json()
-
-    leads = []
-    for row in data:
-        leads.append(SupabaseLead(
-            id=row.get("id", ""),
-            name=row.get("name", ""),
-            email=row.get("email"),
-            phone=row.get("phone"),
-            status=row.get("status", "new"),
-            created_at=row.get("created_at", ""),
-            custom_fields=row.get("custom_fields"),
-        ))
+    if total is not None and len(leads) != total:
+        print(f"  [WARN] Loaded {len(leads)} leads but Supabase reported {total} (table changed during load?)")
 
     print(f"  Total Supabase leads loaded: {len(leads)}")
     return leads
 
 
+def _postgrest_quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def load_supabase_candidates(
+    target: str,
+    zoho_leads: list[ZohoLead],
+    chunk_size: int = 100,
+) -> list[SupabaseLead]:
+    """
+    Load only the Supabase leads that could pair with the Zoho batch by phone or email.
+
+    Phones and emails are looked up on the indexed normalized_phone and
+    normalized_email columns (same keys as the matcher, see migrations 025
+    and 027), in chunks of in.(...) filters. Rows are re-checked with the
+    matcher's own keys (Python and Postgres can disagree on lowercasing
+    non-ASCII), so the candidates are exactly the leads the in-memory index
+    would pair. They come back in the same order as load_supabase_leads, so
+    claims resolve exactly as against the full table.
+
+    Args:
+        target: 'dev' for dev_leads table, 'prod' for leads table
+        zoho_leads: Zoho batch whose phones/emails drive the lookup
+        chunk_size: Values per PostgREST filter
+    """
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        raise Exception("Supabase credentials not configured. Check .env.local file.")
+
+    table = "dev_leads" if target == "dev" else "leads"
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+
+    phones = sorted({z.normalized_phone for z in zoho_leads if z.normalized_phone})
+    emails = sorted({z.email.lower().strip() for z in zoho_leads if z.email and z.email.strip()})
+    print(f"  Fetching {table} candidates for {len(phones)} phones and {len(emails)} emails...")
+
+    filters = [
+        {"normalized_phone": f"in.({','.join(_postgrest_quote(p) for p in phones[i:i + chunk_size])})"}
+        for i in range(0, len(phones), chunk_size)
+    ] + [
+        {"normalized_email": f"in.({','.join(_postgrest_quote(e) for e in emails[i:i + chunk_size])})"}
+        for i in range(0, len(emails), chunk_size)
+    ]
+
+    phone_set, email_set = set(phones), set(emails)
+    found: dict[str, SupabaseLead] = {}
+    for extra in filters:
+        offset = 0
+        while True:
+            params = {"select": SUPABASE_LEAD_COLUMNS, "deleted_at": "is.null", "order": "id.desc", **extra}
+            headers = {**_supabase_headers(), "Range-Unit": "items", "Range": f"{offset}-{offset + SUPABASE_PAGE_SIZE - 1}"}
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+            if response.status_code not in (200, 206):
+                raise Exception(f"Supabase error: {response.status_code} - {response.text}")
+
+            rows = response.json()
+            if not rows:
+                break
+            for row in rows:
+                lead = _supabase_row_to_lead(row)
+                email = lead.email.lower().strip() if lead.email else None
+                if lead.normalized_phone in phone_set or email in email_set:
+                    found.setdefault(lead.id, lead)
+            offset += len(rows)
+
+    # Reproduce the full-table order: NULL created_at first, then newest first
+    undated = [lead for lead in found.values() if not lead.created_at]
+    dated = [lead for lead in found.values() if lead.created_at]
+    leads = sorted(undated, key=lambda lead: lead.id, reverse=True) + sorted(
+        dated, key=lambda lead: (datetime.fromisoformat(lead.created_at), lead.id), reverse=True
+    )
+
+    print(f"  Total Supabase candidates loaded: {len(leads)}")
+    return leads
+
+
+def load_supabase_for_matching(
+    target: str,
+    zoho_leads: list[ZohoLead],
+    pushdown: bool = False,
+    match_names: bool = True,
+) -> list[SupabaseLead]:
+    """
+    Load the Supabase side of a reconciliation.
+
+    With pushdown, only phone/email candidates are fetched, unless the name
+    stage is enabled: fuzzy names can pair with any lead, so that case falls
+    back to the full scan.
+    """
+    if pushdown and not match_names:
+        return load_supabase_candidates(target, zoho_leads)
+    if pushdown:
+        print("  Name matching needs every lead; falling back to a full table scan")
+    return load_supabase_leads(target)
+
+
 # ============================================
 # Matching Logic
 # ============================================
 
-def fuzzy_name_match(name1: Optional[str], name2: Optional[str], threshold: float = 0.85) -> tuple[bool, float]:
+def normalize_name(name: str) -> str:
+    """Lower-case a name and collapse runs of whitespace."""
+    return ' '.join(name.lower().split())
+
+
+def matching_fingerprint(name_threshold: float = NAME_MATCH_THRESHOLD) -> str:
+    """Hash of the settings cached match results depend on (see PairCache)."""
+    settings = json.dumps({'status_map': STATUS_MAP, 'name_threshold': name_threshold}, sort_keys=True)
+    return hashlib.sha256(settings.encode('utf-8')).hexdigest()
+
+
+def fuzzy_name_match(name1: Optional[str], name2: Optional[str], threshold: float = NAME_MATCH_THRESHOLD) -> tuple[bool, float]:
     """
     Check if two names match using fuzzy matching.
     """
     if not name1 or not name2:
         return False, 0.0
 
-    n1 = ' '.join(name1.lower().split())
-    n2 = ' '.join(name2.lower().split())
+    n1 = normalize_name(name1)
+    n2 = normalize_name(name2)
 
     ratio = SequenceMatcher(None, n1, n2).ratio()
     return ratio >= threshold, ratio
 
 
+def _char_counts(text: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for ch in text:
+        counts[ch] = counts.get(ch, 0) + 1
+    return counts
+
+
+def bounded_name_ratio(
+    n1: str,
+    n2: str,
+    threshold: float = NAME_MATCH_THRESHOLD,
+    n1_counts: Optional[dict[str, int]] = None,
+) -> Optional[float]:
+    """
+    SequenceMatcher ratio of two normalized names, or None below threshold.
+
+    Gives up before running SequenceMatcher when a cheap upper bound already
+    rules the pair out: first the length bound (real_quick_ratio), then the
+    character-multiset bound (quick_ratio). Pairs that pass get the exact
+    same ratio as fuzzy_name_match.
+
+    Args:
+        n1: Normalized Zoho name (SequenceMatcher's `a` side)
+        n2: Normalized Supabase name (`b` side)
+        threshold: Minimum ratio to report
+        n1_counts: Precomputed character counts of n1, reused across candidates
+    """
+    total = len(n1) + len(n2)
+    if total:
+        # Both bounds use difflib's own 2.0 * matches / length formula, so
+        # they are never below the real ratio
+        if 2.0 * min(len(n1), len(n2)) / total < threshold:
+            return None
+
+        counts = n1_counts if n1_counts is not None else _char_counts(n1)
+        used: dict[str, int] = {}
+        matches = 0
+        for ch in n2:
+            taken = used.get(ch, 0)
+            if taken < counts.get(ch, 0):
+                matches += 1
+            used[ch] = taken + 1
+        if 2.0 * matches / total < threshold:
+            return None
+
+    ratio = SequenceMatcher(None, n1, n2).ratio()
+    return ratio if ratio >= threshold else None
+
+
+class _ClaimableBucket:
+    """
+    Supabase leads sharing one match key, in load order.
+
+    Claims only ever grow during a run, so the cursor skips claimed leads
+    once and later lookups stay O(1) amortized.
+    """
+
+    __slots__ = ('leads', 'cursor')
+
+    def __init__(self) -> None:
+        self.leads: list[SupabaseLead] = []
+        self.cursor = 0
+
+    def first_unclaimed(self, matched_supabase_ids: set[str]) -> Optional[SupabaseLead]:
+        while self.cursor < len(self.leads) and self.leads[self.cursor].id in matched_supabase_ids:
+            self.cursor += 1
+        if self.cursor < len(self.leads):
+            return self.leads[self.cursor]
+        return None
+
+
+def _name_tokens(normalized: str) -> list[tuple[str, int]]:
+    """
+    Split a normalized name into (char, occurrence) tokens.
+
+    Two names share exactly as many tokens as SequenceMatcher.quick_ratio
+    counts as matching characters, which makes the token overlap an upper
+    bound on the real match count.
+    """
+    seen: dict[str, int] = {}
+    tokens = []
+    for ch in normalized:
+        k = seen.get(ch, 0)
+        seen[ch] = k + 1
+        tokens.append((ch, k))
+    return tokens
+
+
+def _name_prefix_length(length: int, threshold: float) -> int:
+    """
+    Number of rarest tokens that must be indexed/probed for a name of this length.
+
+    A pair can only reach `threshold` if it shares at least
+    threshold * length / (2 - threshold) tokens, so any qualifying pair
+    shares a token within these prefixes (the standard prefix-filter bound).
+    The small epsilon keeps the bound conservative under float rounding.
+    """
+    min_overlap = math.floor(threshold * length / (2 - threshold) - 1e-9)
+    return min(length, length - max(min_overlap, 0) + 1)
+
+
+class SupabaseLeadIndex:
+    """
+    Phone, email and name lookup tables over a list of Supabase leads.
+
+    Built once per reconciliation run. Buckets keep the original list order,
+    so the first unclaimed lead in a bucket is the same lead a linear scan
+    would have returned.
+
+    Names are blocked with a prefix filter over character tokens: only
+    leads sharing a rare token with the Zoho name are scored, and no lead
+    that could reach the threshold is skipped. Pass name_blocking=False to
+    score every lead instead (used to verify recall). With a pair_cache,
+    name scores are looked up by content hash before being computed.
+    """
+
+    def __init__(
+        self,
+        supabase_leads: list[SupabaseLead],
+        name_threshold: float = NAME_MATCH_THRESHOLD,
+        name_blocking: bool = True,
+        pair_cache: Optional[PairCache] = None,
+    ):
+        self.leads = supabase_leads
+        self.name_threshold = name_threshold
+        self.name_blocking = name_blocking
+        self.pair_cache = pair_cache
+        # Positions in the phone index are positions in supabase_leads
+        self.phones = PhoneIndex((sb_lead.id, sb_lead.normalized_phone) for sb_lead in supabase_leads)
+        self._phone_buckets: dict[int, _ClaimableBucket] = {}
+        self.by_email: dict[str, _ClaimableBucket] = {}
+        # Normalized once here instead of once per candidate pair
+        self._names = [normalize_name(sb_lead.name) if sb_lead.name else None for sb_lead in supabase_leads]
+        if pair_cache is not None:
+            self._name_keys = [content_key(n) if n is not None else None for n in self._names]
+
+        for sb_lead in supabase_leads:
+            if sb_lead.email:
+                self.by_email.setdefault(sb_lead.email.lower().strip(), _ClaimableBucket()).leads.append(sb_lead)
+
+        if name_blocking:
+            self._build_name_index()
+
+    def _build_name_index(self) -> None:
+        token_lists: list[Optional[list[tuple[str, int]]]] = []
+        frequency: dict[tuple[str, int], int] = {}
+        for normalized in self._names:
+            # fuzzy_name_match rejects empty names outright
+            if normalized is None:
+                token_lists.append(None)
+                continue
+            tokens = _name_tokens(normalized)
+            token_lists.append(tokens)
+            for token in tokens:
+                frequency[token] = frequency.get(token, 0) + 1
+
+        # Global token order: rarest first, so prefixes are short posting lists
+        self._token_rank = {
+            token: rank
+            for rank, token in enumerate(sorted(frequency, key=lambda t: (frequency[t], t)))
+        }
+        self._postings: dict[tuple[str, int], list[int]] = {}
+        # Whitespace-only names normalize to '' and only match each other
+        self._blank_names: list[int] = []
+
+        for position, tokens in enumerate(token_lists):
+            if tokens is None:
+                continue
+            if not tokens:
+                self._blank_names.append(position)
+                continue
+            for token in self._name_prefix(tokens):
+                self._postings.setdefault(token, []).append(position)
+
+    def _name_prefix(self, tokens: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        # Tokens unseen in Supabase rank first; they never hit a posting list
+        ordered = sorted(tokens, key=lambda t: self._token_rank.get(t, -1))
+        return ordered[:_name_prefix_length(len(tokens), self.name_threshold)]
+
+    def name_candidates(self, name: Optional[str]) -> list[int]:
+        """Positions of leads that could reach the name threshold, in list order."""
+        if not name:
+            return []
+        if not self.name_blocking:
+            return [position for position, normalized in enumerate(self._names) if normalized is not None]
+
+        tokens = _name_tokens(normalize_name(name))
+        if not tokens:
+            return self._blank_names
+
+        found: set[int] = set()
+        for token in self._name_prefix(tokens):
+            found.update(self._postings.get(token, ()))
+        return sorted(found)
+
+    def _name_scorer(self, normalized: str) -> Callable[[int], Optional[float]]:
+        """bounded_name_ratio of one normalized Zoho name against a lead position."""
+        counts = _char_counts(normalized)
+        names, threshold = self._names, self.name_threshold
+        if self.pair_cache is None:
+            return lambda position: bounded_name_ratio(normalized, names[position], threshold, counts)
+
+        cache, keys = self.pair_cache, self._name_keys
+        cached = cache.scores(normalized)
+
+        def cached_score(position: int) -> Optional[float]:
+            key = keys[position]
+            if key in cached:
+                cache.hits += 1
+                return cached[key]
+            cache.misses += 1
+            score = cached[key] = bounded_name_ratio(normalized, names[position], threshold, counts)
+            return score
+
+        return cached_score
+
+    def score_names(self, name: Optional[str]) -> list[tuple[int, float]]:
+        """
+        Score every name candidate, ignoring claims.
+
+        Returns:
+            (position, score) pairs at or above the threshold, in list order
+        """
+        if not name:
+            return []
+
+        name_score = self._name_scorer(normalize_name(name))
+        scores = []
+        for position in self.name_candidates(name):
+            score = name_score(position)
+            if score is not None:
+                scores.append((position, score))
+        return scores
+
+    def resolve_name_scores(
+        self,
+        scores: list[tuple[int, float]],
+        matched_supabase_ids: set[str],
+    ) -> Optional[tuple[SupabaseLead, float]]:
+        """Pick the best unclaimed lead from score_names output (first one wins ties)."""
+        best_name_match: Optional[tuple[SupabaseLead, float]] = None
+        for position, score in scores:
+            sb_lead = self.leads[position]
+            if sb_lead.id in matched_supabase_ids:
+                continue
+            if best_name_match is None or score > best_name_match[1]:
+                best_name_match = (sb_lead, score)
+        return best_name_match
+
+    def match_name(self, name: Optional[str], matched_supabase_ids: set[str]) -> Optional[tuple[SupabaseLead, float]]:
+        """Return the unclaimed lead with the highest fuzzy name score, if any."""
+        if not name:
+            return None
+
+        name_score = self._name_scorer(normalize_name(name))
+        best_name_match: Optional[tuple[SupabaseLead, float]] = None
+        for position in self.name_candidates(name):
+            sb_lead = self.leads[position]
+            if sb_lead.id in matched_supabase_ids:
+                continue
+            score = name_score(position)
+            if score is not None:
+                if best_name_match is None or score > best_name_match[1]:
+                    best_name_match = (sb_lead, score)
+        return best_name_match
+
+    def match_phone(self, phone: Optional[str], matched_supabase_ids: set[str]) -> Optional[SupabaseLead]:
+        """Return the first unclaimed lead with this phone (any format)."""
+        key = phone_key(phone)
+        if key is None:
+            return None
+        bucket = self._phone_buckets.get(key)
+        if bucket is None:
+            positions = self.phones.positions(phone)
+            if not positions:
+                return None
+            # Built on first lookup; it carries the claim cursor from then on
+            bucket = self._phone_buckets[key] = _ClaimableBucket()
+            bucket.leads = [self.leads[position] for position in positions]
+        return bucket.first_unclaimed(matched_supabase_ids)
+
+    def match_email(self, email: Optional[str], matched_supabase_ids: set[str]) -> Optional[SupabaseLead]:
+        """Return the first unclaimed lead with this email (case-insensitive)."""
+        bucket = self.by_email.get(email.lower().strip()) if email else None
+        return bucket.first_unclaimed(matched_supabase_ids) if bucket else None
+
+    def release(self, sb_lead: SupabaseLead) -> None:
+        """
+        Rewind the key buckets of a lead whose claim is being dropped.
+
+        Call after removing its ID from the claimed set; the cursors then
+        re-skip the leads that are still claimed on the next lookup.
+        """
+        key = phone_key(sb_lead.phone)
+        bucket = self._phone_buckets.get(key) if key is not None else None
+        if bucket is not None:
+            bucket.cursor = 0
+        bucket = self.by_email.get(sb_lead.email.lower().strip()) if sb_lead.email else None
+        if bucket is not None:
+            bucket.cursor = 0
+
+
 def find_supabase_match(
     zoho_lead: ZohoLead,
     supabase_leads: list[SupabaseLead],
-    matched_supabase_ids: set[str]
+    matched_supabase_ids: set[str],
+    index: Optional[SupabaseLeadIndex] = None,
+    name_scores: Optional[list[tuple[int, float]]] = None,
+    match_names: bool = True,
 ) -> tuple[Optional[SupabaseLead], str, float]:
     """
     Find matching Supabase lead for a Zoho lead.
@@ -422,61 +1572,256 @@ def find_supabase_match(
     1. Phone (normalized) - highest confidence
     2. Email (case-insensitive) - medium confidence
     3. Name (fuzzy match) - lower confidence
+
+    Pass a prebuilt index when matching many Zoho leads against the same
+    Supabase list; it must not outlive the matched_supabase_ids set it is
+    used with. name_scores, when given, is this lead's precomputed
+    index.score_names() output and replaces the name scan. With
+    match_names=False the name stage is skipped entirely.
     """
+    if index is None:
+        index = SupabaseLeadIndex(supabase_leads)
+
     # 1. Try phone match (highest priority)
-    if zoho_lead.normalized_phone:
-        for sb_lead in supabase_leads:
-            if sb_lead.id in matched_supabase_ids:
-                continue
-            if sb_lead.normalized_phone and sb_lead.normalized_phone == zoho_lead.normalized_phone:
-                return sb_lead, 'phone', 1.0
+    sb_lead = index.match_phone(zoho_lead.normalized_phone, matched_supabase_ids)
+    if sb_lead:
+        return sb_lead, 'phone', 1.0
 
     # 2. Try email match (secondary)
-    if zoho_lead.email:
-        zoho_email_lower = zoho_lead.email.lower().strip()
-        for sb_lead in supabase_leads:
-            if sb_lead.id in matched_supabase_ids:
-                continue
-            if sb_lead.email and sb_lead.email.lower().strip() == zoho_email_lower:
-                return sb_lead, 'email', 0.9
+    sb_lead = index.match_email(zoho_lead.email, matched_supabase_ids)
+    if sb_lead:
+        return sb_lead, 'email', 0.9
 
-    # 3. Try name match (fuzzy, lowest priority)
-    best_name_match: Optional[tuple[SupabaseLead, float]] = None
-    for sb_lead in supabase_leads:
-        if sb_lead.id in matched_supabase_ids:
-            continue
-        is_match, score = fuzzy_name_match(zoho_lead.name, sb_lead.name, threshold=0.85)
-        if is_match:
-            if best_name_match is None or score > best_name_match[1]:
-                best_name_match = (sb_lead, score)
+    if not match_names:
+        return None, 'none', 0.0
 
+    # 3. Try name match (fuzzy, lowest priority)
+    if name_scores is not None:
+        best_name_match = index.resolve_name_scores(name_scores, matched_supabase_ids)
+    else:
+        best_name_match = index.match_name(zoho_lead.name, matched_supabase_ids)
     if best_name_match:
         return best_name_match[0], 'name', best_name_match[1] * 0.7
 
     return None, 'none', 0.0
 
 
-def generate_reconciliation_report(
+_worker_index: Optional[SupabaseLeadIndex] = None
+
+
+def _init_name_worker(supabase_leads: list[SupabaseLead], name_blocking: bool) -> None:
+    global _worker_index
+    _worker_index = SupabaseLeadIndex(supabase_leads, name_blocking=name_blocking)
+
+
+def _score_name_chunk(names: list[str]) -> list[list[tuple[int, float]]]:
+    return [_worker_index.score_names(name) for name in names]
+
+
+def _name_stage_positions(zoho_leads: list[ZohoLead], index: SupabaseLeadIndex) -> list[int]:
+    """Zoho leads with a name and no phone or email bucket, i.e. sure to reach the name stage."""
+    return [
+        i for i, zoho_lead in enumerate(zoho_leads)
+        if zoho_lead.name
+        and zoho_lead.normalized_phone not in index.phones
+        and not (zoho_lead.email and zoho_lead.email.lower().strip() in index.by_email)
+    ]
+
+
+def precompute_name_scores(
     zoho_leads: list[ZohoLead],
-    supabase_leads: list[SupabaseLead]
-) -> ReconciliationReport:
+    supabase_leads: list[SupabaseLead],
+    index: SupabaseLeadIndex,
+    workers: int,
+) -> dict[int, list[tuple[int, float]]]:
     """
-    Generate a reconciliation report matching Zoho and Supabase leads.
+    Score names in a process pool for Zoho leads that will reach the name stage.
+
+    Only leads with no phone or email bucket at all are sent to the pool;
+    the rare lead whose key buckets are all claimed at match time falls
+    back to an in-process name scan. Scores ignore claims, so the parent
+    can still resolve claims in Zoho order.
+
+    Returns:
+        Map of Zoho lead position -> index.score_names() output
     """
-    matches: list[MatchResult] = []
-    matched_supabase_ids: set[str] = set()
+    pending = _name_stage_positions(zoho_leads, index)
+    if not pending:
+        return {}
+
+    chunk_size = max(1, math.ceil(len(pending) / (workers * 4)))
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    print(f"  Scoring names for {len(pending)} Zoho leads with {workers} workers...")
+
+    name_scores: dict[int, list[tuple[int, float]]] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_name_worker,
+        initargs=(supabase_leads, index.name_blocking),
+    ) as executor:
+        chunk_names = ([zoho_leads[i].name for i in chunk] for chunk in chunks)
+        for chunk, results in zip(chunks, executor.map(_score_name_chunk, chunk_names)):
+            name_scores.update(zip(chunk, results))
+    return name_scores
+
+
+def compute_name_scores_numpy(
+    zoho_leads: list[ZohoLead],
+    index: SupabaseLeadIndex,
+    block_elements: int = 1 << 24,
+) -> dict[int, list[tuple[int, float]]]:
+    """
+    Batch name scoring with NumPy matrix products (for large backfills).
 
-    print("\n  Matching leads...")
-    for i, zoho_lead in enumerate(zoho_leads):
-        sb_match, match_type, confidence = find_supabase_match(
-            zoho_lead, supabase_leads, matched_supabase_ids
+    Each name becomes a 0/1 vector over (char, occurrence) tokens, so the
+    dot product of two vectors is exactly the matching-character count
+    behind SequenceMatcher.quick_ratio. A block of Zoho rows times the
+    Supabase matrix gives that upper bound for every pair at once; only
+    pairs whose bound reaches the threshold are re-scored with
+    fuzzy_name_match. Results are identical to index.score_names().
+
+    Args:
+        zoho_leads: Leads to score (only those sure to reach the name stage are scored)
+        index: Index over the Supabase leads
+        block_elements: Max size of one Zoho-block x Supabase bound matrix
+
+    Returns:
+        Map of Zoho lead position -> (position, score) pairs in list order
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for --name-engine numpy. Run:\n"
+            "  pip install numpy"
         )
 
+    pending = _name_stage_positions(zoho_leads, index)
+    if not pending or not index.leads:
+        return {}
+
+    vocabulary: dict[tuple[str, int], int] = {}
+    sb_tokens = []
+    for normalized in index._names:
+        tokens = _name_tokens(normalized) if normalized is not None else []
+        sb_tokens.append(tokens)
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+
+    sb_matrix = np.zeros((len(index.leads), max(len(vocabulary), 1)), dtype=np.float32)
+    for position, tokens in enumerate(sb_tokens):
+        sb_matrix[position, [vocabulary[token] for token in tokens]] = 1.0
+    sb_lengths = np.array([len(n) if n is not None else 0 for n in index._names], dtype=np.float64)
+    # Leads with an empty name never match (fuzzy_name_match rejects them)
+    sb_valid = np.array([n is not None for n in index._names], dtype=bool)
+
+    threshold = index.name_threshold
+    block_size = max(1, block_elements // max(len(index.leads), 1))
+    print(f"  Scoring names for {len(pending)} Zoho leads with NumPy ({len(vocabulary)} tokens)...")
+
+    name_scores: dict[int, list[tuple[int, float]]] = {}
+    for start in range(0, len(pending), block_size):
+        block = pending[start:start + block_size]
+        normalized_block = [normalize_name(zoho_leads[i].name) for i in block]
+
+        zoho_matrix = np.zeros((len(block), sb_matrix.shape[1]), dtype=np.float32)
+        for row, normalized in enumerate(normalized_block):
+            columns = [vocabulary[t] for t in _name_tokens(normalized) if t in vocabulary]
+            zoho_matrix[row, columns] = 1.0
+        zoho_lengths = np.array([len(n) for n in normalized_block], dtype=np.float64)
+
+        overlap = (zoho_matrix @ sb_matrix.T).astype(np.float64)
+        totals = zoho_lengths[:, None] + sb_lengths[None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Two empty strings are a perfect match, as in difflib
+            bound = np.where(totals > 0, 2.0 * overlap / totals, 1.0)
+        # Small slack so float rounding can only add candidates, never drop them
+        passing = (bound >= threshold - 1e-9) & sb_valid[None, :]
+
+        rows, columns = np.nonzero(passing)
+        for i in block:
+            name_scores[i] = []
+        for row, position in zip(rows.tolist(), columns.tolist()):
+            zoho_position = block[row]
+            is_match, score = fuzzy_name_match(zoho_leads[zoho_position].name, index.leads[position].name, threshold)
+            if is_match:
+                name_scores[zoho_position].append((position, score))
+
+    return name_scores
+
+
+class Reconciler:
+    """
+    Incremental matcher: feed Zoho leads in load order, then build the report.
+
+    Claims depend only on the order Zoho leads are matched in, so feeding
+    them batch by batch as pages arrive gives exactly the report a single
+    pass over the full list would.
+
+    With ledger_pairs (MatchLedger.pairs()), settled pairs whose Supabase
+    side is unchanged are claimed up front. A Zoho lead arriving unchanged
+    gets its pair back without running the matcher; a changed one drops
+    the claim and is matched normally. Pass only the pairs of Zoho leads in
+    this run (ledger_pairs_for_run): a claim is held until its Zoho lead
+    arrives, so a pair for a lead outside the run would keep its Supabase
+    lead from every other Zoho lead. Settled name pairs are reused even
+    with match_names off.
+    """
+
+    def __init__(
+        self,
+        supabase_leads: list[SupabaseLead],
+        name_blocking: bool = True,
+        match_names: bool = True,
+        ledger_pairs: Optional[dict[str, LedgerEntry]] = None,
+        pair_cache: Optional[PairCache] = None,
+    ):
+        self.supabase_leads = supabase_leads
+        self.match_names = match_names
+        self.index = SupabaseLeadIndex(supabase_leads, name_blocking=name_blocking, pair_cache=pair_cache)
+        self.matched_supabase_ids: set[str] = set()
+        self.matches: list[MatchResult] = []
+        self.reused_count = 0
+        # Zoho leads expected so far, for progress output (None = unknown)
+        self.total: Optional[int] = None
+
+        self._settled: dict[str, tuple[LedgerEntry, SupabaseLead]] = {}
+        if ledger_pairs:
+            by_id = {sb.id: sb for sb in supabase_leads}
+            for zoho_id, entry in ledger_pairs.items():
+                sb_lead = by_id.get(entry.supabase_id)
+                if sb_lead is None or sb_lead.id in self.matched_supabase_ids:
+                    continue
+                if lead_hash(sb_lead.name, sb_lead.phone, sb_lead.email) != entry.supabase_hash:
+                    continue
+                self._settled[zoho_id] = (entry, sb_lead)
+                self.matched_supabase_ids.add(sb_lead.id)
+
+    def settled(self, zoho_lead: ZohoLead) -> bool:
+        """True if the lead has an unchanged ledger pair waiting for it."""
+        settled = self._settled.get(zoho_lead.id)
+        return settled is not None and settled[0].zoho_hash == lead_hash(zoho_lead.name, zoho_lead.phone, zoho_lead.email)
+
+    def add(self, zoho_lead: ZohoLead, name_scores: Optional[list[tuple[int, float]]] = None) -> MatchResult:
+        """Match the next Zoho lead (name_scores as for find_supabase_match)."""
+        if self.settled(zoho_lead):
+            entry, sb_match = self._settled.pop(zoho_lead.id)
+            match_type, confidence = entry.match_type, entry.match_confidence
+            self.reused_count += 1
+        else:
+            released = self._settled.pop(zoho_lead.id, None)
+            if released is not None:
+                self.matched_supabase_ids.discard(released[1].id)
+                self.index.release(released[1])
+            sb_match, match_type, confidence = find_supabase_match(
+                zoho_lead, self.supabase_leads, self.matched_supabase_ids, self.index, name_scores, self.match_names
+            )
+
         if sb_match:
-            matched_supabase_ids.add(sb_match.id)
+            self.matched_supabase_ids.add(sb_match.id)
             status_differs = zoho_lead.status != sb_match.status
 
-            matches.append(MatchResult(
+            match = MatchResult(
                 zoho_id=zoho_lead.id,
                 zoho_name=zoho_lead.name,
                 zoho_status=zoho_lead.status,
@@ -489,9 +1834,9 @@ def generate_reconciliation_report(
                 match_type=match_type,
                 match_confidence=confidence,
                 status_differs=status_differs,
-            ))
+            )
         else:
-            matches.append(MatchResult(
+            match = MatchResult(
                 zoho_id=zoho_lead.id,
                 zoho_name=zoho_lead.name,
                 zoho_status=zoho_lead.status,
@@ -504,40 +1849,285 @@ def generate_reconciliation_report(
                 match_type='none',
                 match_confidence=0.0,
                 status_differs=False,
+            )
+
+        self.matches.append(match)
+        if len(self.matches) % 50 == 0:
+            total = f"/{self.total}" if self.total is not None else ""
+            print(f"    Processed {len(self.matches)}{total} Zoho leads...")
+        return match
+
+    def add_batch(self, zoho_leads: Iterable[ZohoLead]) -> None:
+        for zoho_lead in zoho_leads:
+            self.add(zoho_lead)
+
+    def save_ledger(self, ledger: MatchLedger) -> None:
+        """Record this run's pairs and drop Zoho leads that are now unmatched."""
+        by_id = {sb.id: sb for sb in self.supabase_leads}
+        entries = []
+        for m in self.matches:
+            if m.supabase_id is None:
+                continue
+            sb_lead = by_id[m.supabase_id]
+            entries.append(LedgerEntry(
+                zoho_id=m.zoho_id,
+                supabase_id=m.supabase_id,
+                match_type=m.match_type,
+                match_confidence=m.match_confidence,
+                zoho_hash=lead_hash(m.zoho_name, m.zoho_phone, m.zoho_email),
+                supabase_hash=lead_hash(sb_lead.name, sb_lead.phone, sb_lead.email),
             ))
+        ledger.record(entries)
+        ledger.forget(m.zoho_id for m in self.matches if m.supabase_id is None)
+        pruned = ledger.prune()
+        print(f"  Ledger: reused {self.reused_count} settled pairs, "
+              f"matched {len(self.matches) - self.reused_count} new or changed leads "
+              f"({len(ledger)} pairs stored, {pruned} stale pairs pruned)")
+
+    def report(self) -> ReconciliationReport:
+        """Build the report for every Zoho lead added so far."""
+        matches = self.matches
+
+        # Claims whose Zoho lead never arrived matched nothing
+        held = {sb_lead.id for _, sb_lead in self._settled.values()}
+
+        # Find unmatched Supabase leads
+        unmatched_supabase = [
+            {'id': sb.id, 'name': sb.name, 'phone': sb.phone, 'email': sb.email, 'status': sb.status}
+            for sb in self.supabase_leads
+            if sb.id not in self.matched_supabase_ids or sb.id in held
+        ]
+
+        # Find unmatched Zoho leads
+        unmatched_zoho = [
+            {'id': m.zoho_id, 'name': m.zoho_name, 'phone': m.zoho_phone, 'email': m.zoho_email, 'status': m.zoho_status}
+            for m in matches
+            if m.match_type == 'none'
+        ]
+
+        status_diff_count = sum(1 for m in matches if m.status_differs)
+
+        return ReconciliationReport(
+            generated_at=datetime.now().isoformat(),
+            zoho_lead_count=len(matches),
+            supabase_lead_count=len(self.supabase_leads),
+            matched_count=len([m for m in matches if m.supabase_id]),
+            unmatched_zoho_count=len(unmatched_zoho),
+            unmatched_supabase_count=len(unmatched_supabase),
+            status_diff_count=status_diff_count,
+            matches=matches,
+            unmatched_zoho=unmatched_zoho,
+            unmatched_supabase=unmatched_supabase,
+        )
 
-        if (i + 1) % 50 == 0:
-            print(f"    Processed {i + 1}/{len(zoho_leads)} Zoho leads...")
 
-    # Find unmatched Supabase leads
-    unmatched_supabase = [
-        {'id': sb.id, 'name': sb.name, 'phone': sb.phone, 'email': sb.email, 'status': sb.status}
-        for sb in supabase_leads
-        if sb.id not in matched_supabase_ids
-    ]
+def open_pair_cache(path: Optional[str]) -> Optional[PairCache]:
+    """Open the name score cache for the current matching settings (None = no cache)."""
+    return PairCache(path, fingerprint=matching_fingerprint()) if path else None
 
-    # Find unmatched Zoho leads
-    unmatched_zoho = [
-        {'id': m.zoho_id, 'name': m.zoho_name, 'phone': m.zoho_phone, 'email': m.zoho_email, 'status': m.zoho_status}
-        for m in matches
-        if m.match_type == 'none'
-    ]
 
-    status_diff_count = sum(1 for m in matches if m.status_differs)
-
-    return ReconciliationReport(
-        generated_at=datetime.now().isoformat(),
-        zoho_lead_count=len(zoho_leads),
-        supabase_lead_count=len(supabase_leads),
-        matched_count=len([m for m in matches if m.supabase_id]),
-        unmatched_zoho_count=len(unmatched_zoho),
-        unmatched_supabase_count=len(unmatched_supabase),
-        status_diff_count=status_diff_count,
-        matches=matches,
-        unmatched_zoho=unmatched_zoho,
-        unmatched_supabase=unmatched_supabase,
+def close_pair_cache(pair_cache: Optional[PairCache]) -> None:
+    """Write out and close the name score cache, printing its hit rate."""
+    if pair_cache is None:
+        return
+    pair_cache.flush()
+    print(f"  Pair cache: {pair_cache.hits} hits, {pair_cache.misses} misses ({len(pair_cache)} pairs stored)")
+    pair_cache.close()
+
+
+def load_ledger_pairs(ledger_path: Optional[Path]) -> Optional[dict[str, LedgerEntry]]:
+    """Settled pairs from the match ledger, or None without one."""
+    if ledger_path is None:
+        return None
+    with MatchLedger(ledger_path) as ledger:
+        pairs = ledger.pairs()
+    print(f"  Match ledger: {len(pairs)} settled pairs")
+    return pairs
+
+
+def ledger_pairs_for_run(
+    ledger_pairs: Optional[dict[str, LedgerEntry]],
+    zoho_leads: list[ZohoLead],
+) -> Optional[dict[str, LedgerEntry]]:
+    """The ledger pairs of Zoho leads in this run (the rest must not hold their Supabase lead)."""
+    if ledger_pairs is None:
+        return None
+    return {zoho_lead.id: ledger_pairs[zoho_lead.id] for zoho_lead in zoho_leads if zoho_lead.id in ledger_pairs}
+
+
+def generate_reconciliation_report(
+    zoho_leads: list[ZohoLead],
+    supabase_leads: list[SupabaseLead],
+    name_blocking: bool = True,
+    workers: int = 1,
+    name_engine: str = 'index',
+    match_names: bool = True,
+    ledger_path: Optional[Path] = None,
+    pair_cache: Optional[PairCache] = None,
+    update_ledger: bool = True,
+) -> ReconciliationReport:
+    """
+    Generate a reconciliation report matching Zoho and Supabase leads.
+
+    Args:
+        zoho_leads: Leads loaded from Zoho, in the order they are matched
+        supabase_leads: Candidate leads loaded from Supabase
+        name_blocking: Score only blocked name candidates (False = exhaustive scan)
+        workers: Processes used for name scoring (1 = single process)
+        name_engine: 'index' (blocked per-lead scoring) or 'numpy' (batch matrix scoring)
+        match_names: Run the fuzzy name stage (False = phone/email only)
+        ledger_path: Match ledger to reuse settled pairs from and update (None = match everything)
+        pair_cache: Name score cache for in-process name matching (the
+            workers/numpy precompute does not use it)
+        update_ledger: Record this run's pairs in the ledger (False = read only)
+    """
+    reconciler = Reconciler(
+        supabase_leads, name_blocking=name_blocking, match_names=match_names,
+        ledger_pairs=ledger_pairs_for_run(load_ledger_pairs(ledger_path), zoho_leads), pair_cache=pair_cache,
     )
 
+    # Settled ledger pairs never reach the name stage, so only score the rest
+    unsettled = [i for i, zoho_lead in enumerate(zoho_leads) if not reconciler.settled(zoho_lead)]
+    to_score = [zoho_leads[i] for i in unsettled]
+
+    scores: dict[int, list[tuple[int, float]]] = {}
+    if not match_names:
+        pass
+    elif name_engine == 'numpy':
+        scores = compute_name_scores_numpy(to_score, reconciler.index)
+    elif workers > 1:
+        scores = precompute_name_scores(to_score, supabase_leads, reconciler.index, workers)
+    name_scores = {unsettled[i]: lead_scores for i, lead_scores in scores.items()}
+
+    print("\n  Matching leads...")
+    reconciler.total = len(zoho_leads)
+    for i, zoho_lead in enumerate(zoho_leads):
+        reconciler.add(zoho_lead, name_scores.get(i))
+
+    if ledger_path is not None and update_ledger:
+        with MatchLedger(ledger_path) as ledger:
+            reconciler.save_ledger(ledger)
+    return reconciler.report()
+
+
+def stream_reconciliation(
+    zoho_batches: Iterator[list[ZohoLead]],
+    load_supabase: Callable[[], list[SupabaseLead]],
+    match_names: bool = True,
+    ledger_path: Optional[Path] = None,
+    pair_cache: Optional[PairCache] = None,
+    update_ledger: bool = True,
+) -> ReconciliationReport:
+    """
+    Load Zoho and Supabase concurrently and match Zoho pages as they arrive.
+
+    Zoho batches are pulled on one thread and Supabase loads on another.
+    Once the Supabase index is built, the calling thread matches the pages
+    buffered so far and then each new page, while later pages are still
+    downloading. Wall-clock time is roughly the slower of the two loads
+    plus matching the last page, instead of the sum of all stages.
+
+    With a ledger, matching waits until the Zoho download is complete:
+    ledger pairs may only be claimed for Zoho leads in this run, and those
+    are known only then. Settled pairs make that matching cheap.
+
+    If the Supabase load fails, the error is raised right away and the Zoho
+    thread stops after the page it is fetching. Progress counts Zoho leads
+    received so far as the total.
+
+    Args:
+        zoho_batches: Zoho leads in match order, e.g. iter_zoho_lead_batches()
+        load_supabase: Callable returning the full Supabase lead list; it must raise on
+            failure (e.g. load_supabase_leads(target, raise_errors=True)) for the Zoho download to stop
+        match_names: Run the fuzzy name stage (False = phone/email only)
+        ledger_path: Match ledger to reuse settled pairs from and update (None = match everything)
+        pair_cache: Name score cache
+        update_ledger: Record this run's pairs in the ledger (False = read only)
+    """
+    ledger_pairs = load_ledger_pairs(ledger_path)
+    done = object()
+    arrived: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    def pull_zoho() -> None:
+        try:
+            for batch in zoho_batches:
+                if stop.is_set():
+                    break
+                arrived.put(batch)
+        except BaseException as e:
+            arrived.put(e)
+        finally:
+            # Cancels the Zoho page requests that have not started yet
+            close = getattr(zoho_batches, "close", None)
+            if close is not None:
+                close()
+            arrived.put(done)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        supabase_future = executor.submit(load_supabase)
+        executor.submit(pull_zoho)
+
+        supabase_leads = supabase_future.result()
+        reconciler: Optional[Reconciler] = None
+        if ledger_pairs is None:
+            reconciler = Reconciler(supabase_leads, match_names=match_names, pair_cache=pair_cache)
+            reconciler.total = 0
+            print("\n  Supabase index ready, matching Zoho pages as they arrive...")
+        else:
+            print("\n  Supabase index ready, waiting for the Zoho download (ledger)...")
+
+        zoho_leads: list[ZohoLead] = []
+        while True:
+            batch = arrived.get()
+            if batch is done:
+                break
+            if isinstance(batch, BaseException):
+                raise batch
+            if reconciler is None:
+                zoho_leads.extend(batch)
+                continue
+            reconciler.total += len(batch)
+            reconciler.add_batch(batch)
+    finally:
+        # On error, don't wait for the rest of the Zoho download
+        stop.set()
+        executor.shutdown(wait=False)
+
+    if reconciler is None:
+        reconciler = Reconciler(
+            supabase_leads, match_names=match_names,
+            ledger_pairs=ledger_pairs_for_run(ledger_pairs, zoho_leads), pair_cache=pair_cache,
+        )
+        reconciler.total = len(zoho_leads)
+        reconciler.add_batch(zoho_leads)
+
+    if ledger_path is not None and update_ledger:
+        with MatchLedger(ledger_path) as ledger:
+            reconciler.save_ledger(ledger)
+    return reconciler.report()
+
+
+def check_name_recall(zoho_leads: list[ZohoLead], supabase_leads: list[SupabaseLead]) -> list[str]:
+    """
+    Compare blocked name matching against the exhaustive scan.
+
+    Returns:
+        One line per Zoho lead whose match differs (empty list = full recall)
+    """
+    blocked = generate_reconciliation_report(zoho_leads, supabase_leads, name_blocking=True)
+    exhaustive = generate_reconciliation_report(zoho_leads, supabase_leads, name_blocking=False)
+
+    differences = []
+    for b, e in zip(blocked.matches, exhaustive.matches):
+        if (b.supabase_id, b.match_type, b.match_confidence) != (e.supabase_id, e.match_type, e.match_confidence):
+            differences.append(
+                f"{e.zoho_name} ({e.zoho_id}): exhaustive={e.supabase_id}/{e.match_type} "
+                f"blocked={b.supabase_id}/{b.match_type}"
+            )
+    return differences
+
 
 # ============================================
 # Output Functions
@@ -640,44 +2230,161 @@ def save_report(report: ReconciliationReport, output_path: str) -> None:
     print(f"\nReport saved to: {output_path}")
 
 
+def reconcile_leads(args: argparse.Namespace, pair_cache: Optional[PairCache]) -> Optional[ReconciliationReport]:
+    """Load both sides and match them as the CLI arguments ask. Returns None when there is nothing to report."""
+    # Streaming needs the whole Supabase table and matches in-process; the
+    # other modes need the full Zoho list first
+    if not (args.no_stream or args.supabase_pushdown or args.check_name_recall
+            or args.workers > 1 or args.name_engine != 'index'):
+        print(f"\nLoading Zoho and Supabase leads (target={args.target}) concurrently...")
+        zoho_batches = iter_zoho_lead_batches(
+            days_back=args.days, concurrency=args.zoho_concurrency,
+            mirror_path=args.zoho_mirror, backfill=args.backfill, use_coql=args.coql,
+        )
+        try:
+            report = stream_reconciliation(
+                zoho_batches, lambda: load_supabase_leads(args.target, raise_errors=True),
+                match_names=not args.skip_name_match,
+                ledger_path=args.ledger, pair_cache=pair_cache, update_ledger=not args.report_only,
+            )
+        except Exception as e:
+            print(f"[ERROR] Failed to load leads: {e}")
+            return None
+
+        if not report.zoho_lead_count:
+            print("\n[WARNING] No Zoho leads loaded.")
+            return None
+        if not report.supabase_lead_count:
+            print("\n[WARNING] No Supabase leads loaded.")
+        return report
+
+    print("\nLoading Zoho leads...")
+    try:
+        zoho_leads = load_zoho_leads(
+            days_back=args.days, concurrency=args.zoho_concurrency,
+            mirror_path=args.zoho_mirror, backfill=args.backfill, use_coql=args.coql,
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to load Zoho leads: {e}")
+        return None
+
+    if not zoho_leads:
+        print("\n[WARNING] No Zoho leads loaded.")
+        return None
+
+    print(f"\nLoading Supabase leads (target={args.target})...")
+    try:
+        supabase_leads = load_supabase_for_matching(
+            args.target, zoho_leads, pushdown=args.supabase_pushdown, match_names=not args.skip_name_match
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to load Supabase leads: {e}")
+        return None
+
+    if not supabase_leads:
+        print("\n[WARNING] No Supabase leads loaded.")
+
+    if args.check_name_recall:
+        print("\nChecking name blocking recall against exhaustive scan...")
+        differences = check_name_recall(zoho_leads, supabase_leads)
+        if differences:
+            print(f"\n[FAIL] {len(differences)} matches differ:")
+            for line in differences:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n[OK] Blocked name matching found the same matches for all {len(zoho_leads)} Zoho leads.")
+        return None
+
+    print("\nGenerating reconciliation report...")
+    return generate_reconciliation_report(
+        zoho_leads, supabase_leads, workers=args.workers, name_engine=args.name_engine,
+        match_names=not args.skip_name_match, ledger_path=args.ledger, pair_cache=pair_cache,
+        update_ledger=not args.report_only,
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate lead reconciliation report')
     parser.add_argument('--report-only', action='store_true', help='Only generate report, no changes')
     parser.add_argument('--output', '-o', type=str, help='Output JSON file path')
     parser.add_argument('--target', choices=['dev', 'prod'], default='dev', help='Target Supabase table')
     parser.add_argument('--days', type=int, default=30, help='Days back to fetch from Zoho')
+    parser.add_argument('--zoho-concurrency', type=int, default=1,
+                        help=f'Zoho page requests in flight at once (max {ZOHO_MAX_CONCURRENCY})')
+    parser.add_argument('--zoho-mirror', nargs='?', const=str(DEFAULT_MIRROR_PATH), default=None, metavar='PATH',
+                        help='Serve Zoho leads from a local SQLite mirror, refreshed incrementally')
+    parser.add_argument('--backfill', action='store_true',
+                        help='Load full Zoho history via the Bulk Read API (ignores --days)')
+    parser.add_argument('--coql', action='store_true',
+                        help='Filter the --days window server-side with COQL (only needed fields)')
+    parser.add_argument('--workers', type=int, default=1, help='Processes used for name matching')
+    parser.add_argument('--name-engine', choices=['index', 'numpy'], default='index',
+                        help='Name matching engine (numpy = batch matrix scoring for large backfills)')
+    parser.add_argument('--skip-name-match', action='store_true', help='Match by phone and email only')
+    parser.add_argument('--supabase-pushdown', action='store_true',
+                        help='Fetch only Supabase leads matching Zoho phones/emails '
+                             '(needs --skip-name-match and migrations 025/027)')
+    parser.add_argument('--check-name-recall', action='store_true',
+                        help='Verify blocked name matching against the exhaustive scan and exit')
+    parser.add_argument('--no-stream', action='store_true',
+                        help='Load Zoho, then Supabase, then match (instead of overlapping them)')
+    parser.add_argument('--ledger', nargs='?', const=str(DEFAULT_LEDGER_PATH), default=None, metavar='PATH',
+                        help='Reuse unchanged pairs from a persisted match ledger (updated unless --report-only)')
+    parser.add_argument('--pair-cache', nargs='?', const=str(DEFAULT_PAIR_CACHE_PATH), default=None, metavar='PATH',
+                        help='Cache fuzzy name scores on disk across runs')
+    parser.add_argument('--out-of-core', action='store_true',
+                        help='Match by phone/email via on-disk sorted runs (bounded memory, needs --output)')
+    parser.add_argument('--spill-dir', type=str, default=None,
+                        help='Directory for --out-of-core temporary files (default: system temp)')
+    parser.add_argument('--run-size', type=int, default=100_000,
+                        help='Records per --out-of-core sorted run (bounds memory)')
 
     args = parser.parse_args()
+    if args.out_of_core and not args.output:
+        parser.error('--out-of-core requires --output')
 
     print("=" * 60)
     print("LEAD RECONCILIATION")
     print("=" * 60)
 
-    print("\nLoading Zoho leads...")
-    try:
-        zoho_leads = load_zoho_leads(days_back=args.days)
-    except Exception as e:
-        print(f"[ERROR] Failed to load Zoho leads: {e}")
-        return
+    if args.out_of_core:
+        from scripts.sync.external_reconcile import print_summary, reconcile_out_of_core
 
-    print(f"\nLoading Supabase leads (target={args.target})...")
-    try:
-        supabase_leads = load_supabase_leads(args.target)
-    except Exception as e:
-        print(f"[ERROR] Failed to load Supabase leads: {e}")
-        return
+        # Bulk Read returns leads unordered; the other sources are already newest first
+        if args.backfill:
+            zoho_leads = iter_zoho_leads_bulk()
+        else:
+            zoho_leads = (lead for batch in iter_zoho_lead_batches(
+                days_back=args.days, concurrency=args.zoho_concurrency,
+                mirror_path=args.zoho_mirror, use_coql=args.coql,
+            ) for lead in batch)
 
-    if not zoho_leads:
-        print("\n[WARNING] No Zoho leads loaded.")
-        return
+        print(f"\nReconciling out of core (target={args.target})...")
+        try:
+            summary = reconcile_out_of_core(
+                zoho_leads, iter_supabase_leads(args.target), args.output,
+                run_size=args.run_size, spill_dir=args.spill_dir, sort_zoho_by_created=args.backfill,
+            )
+        except Exception as e:
+            print(f"[ERROR] Failed to reconcile: {e}")
+            return
 
-    if not supabase_leads:
-        print("\n[WARNING] No Supabase leads loaded.")
+        print_summary(summary)
+        print(f"\nReport saved to: {args.output}")
+        return
 
-    print("\nGenerating reconciliation report...")
-    report = generate_reconciliation_report(zoho_leads, supabase_leads)
+    pair_cache = open_pair_cache(args.pair_cache)
+    try:
+        report = reconcile_leads(args, pair_cache)
+    finally:
+        # Flush the scores computed so far, even when loading failed midway
+        close_pair_cache(pair_cache)
+    if report is None:
+        return
 
     print_report(report)
+    if args.supabase_pushdown and args.skip_name_match:
+        print("Note: Supabase counts cover only the phone/email candidates that were fetched.")
 
     if args.output:
         save_report(report, args.output)
@@ -20,15 +20,27 @@ Usage:
 
     # Sync to production (after validation)
     python scripts/sync/status_sync.py --target prod
+
+    # Apply as chunked array upserts instead of three requests per lead
+    # (not atomic, so dev only: see apply_update_chunk)
+    python scripts/sync/status_sync.py --target dev --apply-mode bulk
+
+    # Apply through the atomic server-side merge (needs migration 026)
+    python scripts/sync/status_sync.py --target prod --apply-mode rpc
+
+    # Per-lead writes with up to 8 leads in flight (backs off on 429/5xx)
+    python scripts/sync/status_sync.py --target prod --write-workers 8
 """
 
 import argparse
 import json
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 
 import requests
@@ -41,12 +53,24 @@ from scripts.sync.reconcile import (
     ZohoLead,
     SupabaseLead,
     MatchResult,
+    ReconciliationReport,
     generate_reconciliation_report,
-    load_zoho_leads,
+    iter_zoho_lead_batches,
     load_supabase_leads,
+    stream_reconciliation,
+    load_zoho_leads,
+    load_zoho_notes,
+    load_supabase_for_matching,
+    open_pair_cache,
+    close_pair_cache,
     SUPABASE_URL,
     SUPABASE_SERVICE_KEY,
+    _supabase_headers,
 )
+from scripts.sync.adaptive_limiter import AdaptiveLimiter, send_request
+from scripts.sync.match_ledger import DEFAULT_LEDGER_PATH
+from scripts.sync.pair_cache import DEFAULT_PAIR_CACHE_PATH, PairCache
+from scripts.sync.zoho_mirror import DEFAULT_MIRROR_PATH
 
 
 # Valid statuses in our system (14 canonical statuses)
@@ -66,7 +90,17 @@ VALID_STATUSES = {
 }
 
 
-@dataclass
+# Updates per upsert / event insert request or RPC call (--apply-mode bulk/rpc)
+BULK_CHUNK_SIZE = 500
+# Lead IDs per custom_fields GET, keeping the in.(...) URL short
+BULK_FETCH_SIZE = 100
+
+# Upper bound for --write-workers; each worker holds a PostgREST connection
+# from the pool the app shares
+SUPABASE_MAX_WRITE_WORKERS = 16
+
+
+@dataclass(slots=True)
 class StatusUpdate:
     """A pending status update."""
     supabase_id: str
@@ -132,6 +166,36 @@ def get_pending_updates(matches: list[MatchResult], include_notes_only: bool = F
     return updates
 
 
+def attach_zoho_notes(
+    matches: list[MatchResult],
+    include_notes_only: bool = False,
+    mirror_path: Optional[str] = None,
+) -> int:
+    """
+    Fill in zoho_notes for a lazy-notes run, fetching only what will be written.
+
+    Notes are fetched for matches that get_pending_updates could turn into
+    an update: matched, valid status, and a status change (or any match when
+    include_notes_only, since there the notes decide).
+
+    Returns:
+        Number of matches whose notes were requested
+    """
+    wanted = [
+        match for match in matches
+        if match.supabase_id
+        and match.zoho_status in VALID_STATUSES
+        and (match.status_differs or include_notes_only)
+    ]
+    if not wanted:
+        return 0
+
+    notes = load_zoho_notes([match.zoho_id for match in wanted], mirror_path=mirror_path)
+    for match in wanted:
+        match.zoho_notes = notes.get(match.zoho_id)
+    return len(wanted)
+
+
 def print_pending_updates(updates: list[StatusUpdate]) -> None:
     """Print a summary of pending updates."""
     print("\n" + "=" * 60)
@@ -192,10 +256,47 @@ def apply_updates_dry_run(updates: list[StatusUpdate]) -> SyncResult:
     )
 
 
-def apply_single_update(update: StatusUpdate, target: str) -> tuple[bool, str]:
+def merged_custom_fields(current: Optional[dict], update: StatusUpdate) -> dict:
+    """A lead's custom_fields with the Zoho ID (and notes, if any) merged in."""
+    custom_fields = {**(current or {}), "zoho_id": update.zoho_id}
+    if update.zoho_notes:
+        custom_fields["zoho_notes"] = update.zoho_notes
+    return custom_fields
+
+
+def status_event(update: StatusUpdate) -> dict:
+    """lead_events row recording a synced status change."""
+    return {
+        "lead_id": update.supabase_id,
+        "event_type": "status_changed",
+        "field_name": "status",
+        "old_value": update.old_status,
+        "new_value": update.new_status,
+        "user_email": "sync@zoho-reconciliation",
+        "metadata": {
+            "source": "zoho_sync",
+            "zoho_id": update.zoho_id,
+            "match_type": update.match_type,
+            "match_confidence": update.match_confidence,
+        },
+    }
+
+
+def apply_single_update(
+    update: StatusUpdate,
+    target: str,
+    limiter: Optional[AdaptiveLimiter] = None,
+    warnings: Optional[list[str]] = None,
+) -> tuple[bool, str]:
     """
     Apply a single status update to Supabase.
 
+    Args:
+        update: The update
+        target: 'dev' or 'prod'
+        limiter: Shared concurrency cap; requests are throttled and retried through it
+        warnings: Collects warnings instead of printing them (for ordered output)
+
     Returns:
         Tuple of (success, error_message)
     """
@@ -212,7 +313,7 @@ def apply_single_update(update: StatusUpdate, target: str) -> tuple[bool, str]:
     try:
         # Step 1: Get current custom_fields
         get_url = f"{SUPABASE_URL}/rest/v1/{table}?id=eq.{update.supabase_id}&select=custom_fields"
-        get_response = requests.get(get_url, headers=headers, timeout=30)
+        get_response = send_request(requests.get, get_url, limiter, headers=headers, timeout=30)
 
         if get_response.status_code != 200:
             return False, f"Failed to fetch lead: {get_response.text}"
@@ -221,47 +322,30 @@ def apply_single_update(update: StatusUpdate, target: str) -> tuple[bool, str]:
         if not data:
             return False, "Lead not found"
 
-        current_custom_fields = data[0].get("custom_fields") or {}
-
         # Step 2: Update lead with new status, zoho_id, and notes
-        updated_custom_fields = {**current_custom_fields, "zoho_id": update.zoho_id}
-        if update.zoho_notes:
-            updated_custom_fields["zoho_notes"] = update.zoho_notes
-
         update_url = f"{SUPABASE_URL}/rest/v1/{table}?id=eq.{update.supabase_id}"
         update_data = {
             "status": update.new_status,
-            "custom_fields": updated_custom_fields,
+            "custom_fields": merged_custom_fields(data[0].get("custom_fields"), update),
             "updated_at": datetime.now().isoformat(),
         }
 
-        update_response = requests.patch(update_url, headers=headers, json=update_data, timeout=30)
+        update_response = send_request(requests.patch, update_url, limiter, headers=headers, json=update_data, timeout=30)
 
         if update_response.status_code not in [200, 204]:
             return False, f"Failed to update lead: {update_response.text}"
 
         # Step 3: Insert lead_event for audit trail
         event_url = f"{SUPABASE_URL}/rest/v1/{events_table}"
-        event_data = {
-            "lead_id": update.supabase_id,
-            "event_type": "status_changed",
-            "field_name": "status",
-            "old_value": update.old_status,
-            "new_value": update.new_status,
-            "user_email": "sync@zoho-reconciliation",
-            "metadata": {
-                "source": "zoho_sync",
-                "zoho_id": update.zoho_id,
-                "match_type": update.match_type,
-                "match_confidence": update.match_confidence,
-            },
-        }
-
-        event_response = requests.post(event_url, headers=headers, json=event_data, timeout=30)
+        event_response = send_request(requests.post, event_url, limiter, headers=headers, json=status_event(update), timeout=30)
 
         if event_response.status_code not in [200, 201, 204]:
             # Log warning but don't fail the update
-            print(f"    [WARN] Failed to create event: {event_response.text}")
+            warning = f"    [WARN] Failed to create event: {event_response.text}"
+            if warnings is None:
+                print(warning)
+            else:
+                warnings.append(warning)
 
         return True, ""
 
@@ -269,11 +353,215 @@ def apply_single_update(update: StatusUpdate, target: str) -> tuple[bool, str]:
         return False, str(e)
 
 
-def apply_updates(updates: list[StatusUpdate], target: str) -> SyncResult:
+def fetch_lead_rows(ids: list[str], target: str) -> dict[str, dict]:
+    """id, name and custom_fields of the given leads, by ID (missing leads are left out)."""
+    table = "dev_leads" if target == "dev" else "leads"
+    rows: dict[str, dict] = {}
+    for i in range(0, len(ids), BULK_FETCH_SIZE):
+        response = requests.get(
+            f"{SUPABASE_URL}/rest/v1/{table}",
+            headers=_supabase_headers(),
+            params={"id": f"in.({','.join(ids[i:i + BULK_FETCH_SIZE])})", "select": "id,name,custom_fields"},
+            timeout=30,
+        )
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch leads: {response.text}")
+        rows.update((row["id"], row) for row in response.json())
+    return rows
+
+
+def apply_update_chunk(chunk: list[StatusUpdate], target: str) -> dict[str, str]:
+    """
+    Apply a chunk of updates with one upsert and one event insert.
+
+    The current custom_fields are read first (BULK_FETCH_SIZE leads per
+    GET), merged, and written back as a single array upsert on id.
+
+    PostgREST can only write different values to many rows through an
+    upsert, and nothing locks the rows between the GET and the upsert:
+    - name is sent as read (the insert check needs it), so a rename made
+      in between is reverted, as are custom_fields keys edited in between
+    - a lead deleted in between is inserted again with only these columns
+    main() therefore refuses this mode for prod; apply_update_chunk_rpc
+    has neither problem. Per-row results come from the rows the upsert
+    returns.
+
+    Returns:
+        Error message per Supabase ID ('' = applied)
+
+    Raises:
+        Exception: a request failed as a whole (nothing in the chunk was written)
+    """
+    table = "dev_leads" if target == "dev" else "leads"
+    events_table = "dev_lead_events" if target == "dev" else "lead_events"
+
+    current = fetch_lead_rows([u.supabase_id for u in chunk], target)
+    outcome = {u.supabase_id: "Lead not found" for u in chunk if u.supabase_id not in current}
+    found = [u for u in chunk if u.supabase_id in current]
+    if not found:
+        return outcome
+
+    now = datetime.now().isoformat()
+    rows = [
+        {
+            "id": u.supabase_id,
+            # Upsert rows are checked as inserts first, so NOT NULL name has to be sent
+            "name": current[u.supabase_id]["name"],
+            "status": u.new_status,
+            "custom_fields": merged_custom_fields(current[u.supabase_id].get("custom_fields"), u),
+            "updated_at": now,
+        }
+        for u in found
+    ]
+    response = requests.post(
+        f"{SUPABASE_URL}/rest/v1/{table}",
+        headers={**_supabase_headers(), "Prefer": "resolution=merge-duplicates,return=representation"},
+        params={"on_conflict": "id", "select": "id"},
+        json=rows,
+        timeout=60,
+    )
+    if response.status_code not in [200, 201]:
+        raise Exception(f"Failed to upsert leads: {response.text}")
+
+    written = {row["id"] for row in response.json()}
+    for u in found:
+        outcome[u.supabase_id] = "" if u.supabase_id in written else "Not written by upsert"
+
+    events = [status_event(u) for u in found if u.supabase_id in written]
+    if events:
+        event_response = requests.post(
+            f"{SUPABASE_URL}/rest/v1/{events_table}",
+            headers={**_supabase_headers(), "Prefer": "return=minimal"},
+            json=events,
+            timeout=60,
+        )
+        if event_response.status_code not in [200, 201, 204]:
+            # Log warning but don't fail the updates
+            print(f"    [WARN] Failed to create {len(events)} events: {event_response.text}")
+
+    return outcome
+
+
+def apply_update_chunk_rpc(chunk: list[StatusUpdate], target: str) -> dict[str, str]:
+    """
+    Apply a chunk of updates with one call to sync_zoho_updates() (migration 026).
+
+    The function merges custom_fields with jsonb ||, sets the status and
+    inserts the events in one transaction, so nothing is read client-side
+    and concurrent edits to other custom_fields keys are kept.
+
+    Returns:
+        Error message per Supabase ID ('' = applied)
+
+    Raises:
+        Exception: the call failed (the transaction was rolled back)
+    """
+    payload = [
+        {
+            "supabase_id": u.supabase_id,
+            "old_status": u.old_status,
+            "new_status": u.new_status,
+            "zoho_id": u.zoho_id,
+            "zoho_notes": u.zoho_notes,
+            "match_type": u.match_type,
+            "match_confidence": u.match_confidence,
+        }
+        for u in chunk
+    ]
+    response = requests.post(
+        f"{SUPABASE_URL}/rest/v1/rpc/sync_zoho_updates",
+        headers=_supabase_headers(),
+        json={"updates": payload, "target": target},
+        timeout=60,
+    )
+    if response.status_code != 200:
+        raise Exception(f"sync_zoho_updates failed: {response.text}")
+
+    applied = {row["lead_id"] for row in response.json() if row["applied"]}
+    return {u.supabase_id: "" if u.supabase_id in applied else "Lead not found" for u in chunk}
+
+
+CHUNK_APPLIERS = {
+    'bulk': apply_update_chunk,
+    'rpc': apply_update_chunk_rpc,
+}
+
+
+def iter_chunk_outcomes(
+    updates: list[StatusUpdate],
+    target: str,
+    mode: str,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> Iterator[tuple[StatusUpdate, bool, str]]:
+    """Apply updates chunk by chunk ('bulk' or 'rpc'); yields (update, success, error) in input order."""
+    apply_chunk = CHUNK_APPLIERS[mode]
+    for start in range(0, len(updates), chunk_size):
+        chunk = updates[start:start + chunk_size]
+        try:
+            outcome = apply_chunk(chunk, target)
+        except Exception as e:
+            # Find the offending rows without losing the rest of the chunk
+            print(f"  [WARN] Batch write failed ({e}), retrying {len(chunk)} updates one by one")
+            for update in chunk:
+                yield update, *apply_single_update(update, target)
+            continue
+        for update in chunk:
+            yield update, not outcome[update.supabase_id], outcome[update.supabase_id]
+
+
+def iter_concurrent_outcomes(
+    updates: list[StatusUpdate],
+    target: str,
+    workers: int,
+) -> Iterator[tuple[StatusUpdate, bool, str]]:
+    """
+    Apply updates one lead at a time on a thread pool; yields (update, success, error) in input order.
+
+    An AdaptiveLimiter shared by the workers caps the requests in flight,
+    backing off on 429/5xx. Warnings are printed with their update, so the
+    output reads the same as a serial run.
+    """
+    limiter = AdaptiveLimiter(workers)
+
+    def apply(update: StatusUpdate) -> tuple[bool, str, list[str]]:
+        warnings: list[str] = []
+        success, error_msg = apply_single_update(update, target, limiter, warnings)
+        return success, error_msg, warnings
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        in_flight: deque = deque()
+        next_index = 0
+        while in_flight or next_index < len(updates):
+            # Queue a little ahead so a slow lead doesn't idle the other workers
+            while next_index < len(updates) and len(in_flight) < 2 * workers:
+                update = updates[next_index]
+                in_flight.append((update, executor.submit(apply, update)))
+                next_index += 1
+            update, future = in_flight.popleft()
+            success, error_msg, warnings = future.result()
+            for warning in warnings:
+                print(warning)
+            yield update, success, error_msg
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        print(f"  Write throttling: {limiter.summary()}")
+
+
+def apply_updates(updates: list[StatusUpdate], target: str, mode: str = 'serial', workers: int = 1) -> SyncResult:
     """
     Apply status updates to Supabase.
+
+    Args:
+        updates: Pending updates
+        target: 'dev' or 'prod'
+        mode: 'serial' (three requests per lead), 'bulk' (chunked array upserts)
+            or 'rpc' (one sync_zoho_updates() call per chunk)
+        workers: Leads written at once in serial mode (capped at SUPABASE_MAX_WRITE_WORKERS)
     """
-    print(f"\n[SYNC] Applying {len(updates)} updates to {target}...")
+    workers = max(1, min(workers, SUPABASE_MAX_WRITE_WORKERS)) if mode not in CHUNK_APPLIERS else 1
+    in_flight = f", up to {workers} leads at once" if workers > 1 else ""
+    print(f"\n[SYNC] Applying {len(updates)} updates to {target} ({mode}{in_flight})...")
 
     if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
         return SyncResult(
@@ -288,9 +576,14 @@ def apply_updates(updates: list[StatusUpdate], target: str) -> SyncResult:
     succeeded = 0
     failed = 0
 
-    for i, update in enumerate(updates, 1):
-        success, error_msg = apply_single_update(update, target)
+    if mode in CHUNK_APPLIERS:
+        outcomes = iter_chunk_outcomes(updates, target, mode)
+    elif workers > 1:
+        outcomes = iter_concurrent_outcomes(updates, target, workers)
+    else:
+        outcomes = ((update, *apply_single_update(update, target)) for update in updates)
 
+    for i, (update, success, error_msg) in enumerate(outcomes, 1):
         if success:
             succeeded += 1
             print(f"  [{i}/{len(updates)}] OK: {update.lead_name} ({update.old_status} -> {update.new_status})")
@@ -340,6 +633,77 @@ def save_sync_log(updates: list[StatusUpdate], result: SyncResult, output_path:
     print(f"\nSync log saved to: {output_path}")
 
 
+def load_and_reconcile(
+    args: argparse.Namespace,
+    pair_cache: Optional[PairCache] = None,
+) -> Optional[ReconciliationReport]:
+    """Load Zoho, then Supabase, then match. Returns None if a load failed."""
+    print("\nLoading Zoho leads...")
+    try:
+        zoho_leads = load_zoho_leads(
+            days_back=args.days, concurrency=args.zoho_concurrency,
+            mirror_path=args.zoho_mirror, backfill=args.backfill, use_coql=args.coql,
+            lazy_notes=args.lazy_notes,
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to load Zoho leads: {e}")
+        return None
+
+    if not zoho_leads:
+        print("\n[ERROR] No Zoho leads loaded.")
+        return None
+
+    print(f"\nLoading Supabase leads (target={args.target})...")
+    try:
+        supabase_leads = load_supabase_for_matching(
+            args.target, zoho_leads, pushdown=args.supabase_pushdown, match_names=not args.skip_name_match
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to load Supabase leads: {e}")
+        return None
+
+    if not supabase_leads:
+        print("\n[ERROR] No Supabase leads loaded.")
+        return None
+
+    # Generate reconciliation report
+    print("\nGenerating reconciliation report...")
+    return generate_reconciliation_report(
+        zoho_leads, supabase_leads, workers=args.workers, match_names=not args.skip_name_match,
+        ledger_path=args.ledger, pair_cache=pair_cache, update_ledger=not args.dry_run,
+    )
+
+
+def load_and_reconcile_streaming(
+    args: argparse.Namespace,
+    pair_cache: Optional[PairCache] = None,
+) -> Optional[ReconciliationReport]:
+    """Load Zoho and Supabase concurrently, matching Zoho pages as they arrive."""
+    print(f"\nLoading Zoho and Supabase leads (target={args.target}) concurrently...")
+    zoho_batches = iter_zoho_lead_batches(
+        days_back=args.days, concurrency=args.zoho_concurrency,
+        mirror_path=args.zoho_mirror, backfill=args.backfill, use_coql=args.coql,
+        lazy_notes=args.lazy_notes,
+    )
+    try:
+        report = stream_reconciliation(
+            zoho_batches, lambda: load_supabase_leads(args.target, raise_errors=True),
+            match_names=not args.skip_name_match,
+            ledger_path=args.ledger, pair_cache=pair_cache, update_ledger=not args.dry_run,
+        )
+    except Exception as e:
+        print(f"[ERROR] Failed to load leads: {e}")
+        return None
+
+    if not report.zoho_lead_count:
+        print("\n[ERROR] No Zoho leads loaded.")
+        return None
+    if not report.supabase_lead_count:
+        print("\n[ERROR] No Supabase leads loaded.")
+        return None
+    return report
+
+
 def main():
     parser = argparse.ArgumentParser(description='Sync lead statuses and notes from Zoho to Supabase')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
@@ -348,39 +712,62 @@ def main():
     parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
     parser.add_argument('--days', type=int, default=30, help='Days back to fetch from Zoho')
     parser.add_argument('--sync-notes', action='store_true', help='Also sync notes for leads without status changes')
+    parser.add_argument('--zoho-concurrency', type=int, default=1, help='Zoho page requests in flight at once')
+    parser.add_argument('--zoho-mirror', nargs='?', const=str(DEFAULT_MIRROR_PATH), default=None, metavar='PATH',
+                        help='Serve Zoho leads from a local SQLite mirror, refreshed incrementally')
+    parser.add_argument('--backfill', action='store_true',
+                        help='Load full Zoho history via the Bulk Read API (ignores --days)')
+    parser.add_argument('--coql', action='store_true',
+                        help='Filter the --days window server-side with COQL (only needed fields)')
+    parser.add_argument('--workers', type=int, default=1, help='Processes used for name matching')
+    parser.add_argument('--lazy-notes', action='store_true',
+                        help='Load Zoho leads without notes, then fetch notes only for leads being updated')
+    parser.add_argument('--skip-name-match', action='store_true', help='Match by phone and email only')
+    parser.add_argument('--supabase-pushdown', action='store_true',
+                        help='Fetch only Supabase leads matching Zoho phones/emails '
+                             '(needs --skip-name-match and migrations 025/027)')
+    parser.add_argument('--no-stream', action='store_true',
+                        help='Load Zoho, then Supabase, then match (instead of overlapping them)')
+    parser.add_argument('--ledger', nargs='?', const=str(DEFAULT_LEDGER_PATH), default=None, metavar='PATH',
+                        help='Reuse unchanged pairs from a persisted match ledger (updated unless --dry-run)')
+    parser.add_argument('--pair-cache', nargs='?', const=str(DEFAULT_PAIR_CACHE_PATH), default=None, metavar='PATH',
+                        help='Cache fuzzy name scores on disk across runs')
+    parser.add_argument('--apply-mode', choices=['serial', 'bulk', 'rpc'], default='serial',
+                        help=f'serial = 3 requests per lead, bulk = array upserts of {BULK_CHUNK_SIZE} leads '
+                             f'(not atomic: can revert a rename or re-create a lead deleted during the run, '
+                             f'so dev only), rpc = one atomic sync_zoho_updates() call per {BULK_CHUNK_SIZE} leads '
+                             f'(migration 026)')
+    parser.add_argument('--write-workers', type=int, default=1,
+                        help=f'Leads written at once with --apply-mode serial, backing off on 429/5xx '
+                             f'(max {SUPABASE_MAX_WRITE_WORKERS})')
 
     args = parser.parse_args()
+    if args.apply_mode == 'bulk' and args.target == 'prod':
+        parser.error('--apply-mode bulk is not atomic and is refused for prod, use --apply-mode rpc')
 
     print("=" * 60)
     print("ZOHO -> SUPABASE SYNC" + (" (with notes)" if args.sync_notes else ""))
     print("=" * 60)
 
-    # Load data
-    print("\nLoading Zoho leads...")
+    pair_cache = open_pair_cache(args.pair_cache)
     try:
-        zoho_leads = load_zoho_leads(days_back=args.days)
-    except Exception as e:
-        print(f"[ERROR] Failed to load Zoho leads: {e}")
-        return
-
-    print(f"\nLoading Supabase leads (target={args.target})...")
-    try:
-        supabase_leads = load_supabase_leads(args.target)
-    except Exception as e:
-        print(f"[ERROR] Failed to load Supabase leads: {e}")
-        return
-
-    if not zoho_leads:
-        print("\n[ERROR] No Zoho leads loaded.")
-        return
-
-    if not supabase_leads:
-        print("\n[ERROR] No Supabase leads loaded.")
+        if not (args.no_stream or args.supabase_pushdown or args.workers > 1):
+            report = load_and_reconcile_streaming(args, pair_cache)
+        else:
+            report = load_and_reconcile(args, pair_cache)
+    finally:
+        # Flush the scores computed so far, even when matching failed midway
+        close_pair_cache(pair_cache)
+    if report is None:
         return
 
-    # Generate reconciliation report
-    print("\nGenerating reconciliation report...")
-    report = generate_reconciliation_report(zoho_leads, supabase_leads)
+    if args.lazy_notes:
+        print("\nFetching Zoho notes for leads to update...")
+        try:
+            attach_zoho_notes(report.matches, include_notes_only=args.sync_notes, mirror_path=args.zoho_mirror)
+        except Exception as e:
+            print(f"[ERROR] Failed to load Zoho notes: {e}")
+            return
 
     # Get pending updates
     updates = get_pending_updates(report.matches, include_notes_only=args.sync_notes)
@@ -405,7 +792,7 @@ def main():
                 print("Aborted.")
                 return
 
-        result = apply_updates(updates, args.target)
+        result = apply_updates(updates, args.target, mode=args.apply_mode, workers=args.write_workers)
 
         # Print results
         print("\n" + "=" * 60)
@@ -0,0 +1,114 @@
+"""
+Local SQLite mirror of Zoho CRM lead records.
+
+Stores the raw Zoho API records so reconcile and status_sync runs can be
+served locally. Only leads modified or deleted since the previous run have
+to be fetched from Zoho (see refresh_zoho_mirror in reconcile.py).
+
+Mirror state:
+- synced_at: Zoho time the last refresh started (next If-Modified-Since)
+- covered_since: oldest Created_Time cutoff fully loaded into the mirror
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+DEFAULT_MIRROR_PATH = Path(__file__).parent / ".zoho_mirror.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS zoho_leads (
+    id TEXT PRIMARY KEY,
+    created_time TEXT,
+    modified_time TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_zoho_leads_created_time ON zoho_leads(created_time);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class ZohoMirror:
+    """SQLite-backed store of raw Zoho lead records."""
+
+    def __init__(self, path: Path = DEFAULT_MIRROR_PATH):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ZohoMirror":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # State
+
+    def get_state(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM mirror_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO mirror_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+        self.conn.commit()
+
+    def clear_state(self, key: str) -> None:
+        self.conn.execute("DELETE FROM mirror_state WHERE key = ?", (key,))
+        self.conn.commit()
+
+    # Records
+
+    def upsert(self, records: Iterable[dict]) -> int:
+        """Insert or replace raw Zoho records. Returns the number written."""
+        rows = [
+            (r["id"], r.get("Created_Time"), r.get("Modified_Time"), json.dumps(r, ensure_ascii=False))
+            for r in records
+            if r.get("id")
+        ]
+        self.conn.executemany(
+            "INSERT INTO zoho_leads (id, created_time, modified_time, record) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET created_time = excluded.created_time, "
+            "modified_time = excluded.modified_time, record = excluded.record",
+            rows,
+        )
+        self.conn.commit()
+        return len(rows)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove records deleted in Zoho. Returns the number removed."""
+        cursor = self.conn.executemany("DELETE FROM zoho_leads WHERE id = ?", [(i,) for i in ids])
+        self.conn.commit()
+        return cursor.rowcount
+
+    def records(self) -> list[dict]:
+        """All mirrored records, newest Created_Time first."""
+        rows = self.conn.execute("SELECT record FROM zoho_leads ORDER BY created_time DESC, id DESC")
+        return [json.loads(row[0]) for row in rows]
+
+    def records_by_id(self, ids: Iterable[str]) -> dict[str, dict]:
+        """Mirrored records for the given IDs (missing IDs are left out)."""
+        ids = list(ids)
+        found: dict[str, dict] = {}
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT id, record FROM zoho_leads WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            )
+            found.update((row[0], json.loads(row[1])) for row in rows)
+        return found
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM zoho_leads").fetchone()[0]
@@ -0,0 +1,118 @@
+"""
+On-disk cache for the Zoho OAuth access token.
+
+Zoho access tokens live for an hour, but every CLI run used to exchange
+the refresh token again (and sometimes probe several regions first). The
+cache stores the token, its expiry and the resolved region/API URL in a
+JSON file shared by all scripts. An exclusive file lock around
+read-refresh-write means that when reconcile and status_sync start
+together, only one of them talks to the Zoho accounts server.
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, cache still works
+    fcntl = None
+
+
+DEFAULT_TOKEN_CACHE_PATH = Path(__file__).parent / ".zoho_token.json"
+
+# Refresh this many seconds before Zoho's stated expiry
+EXPIRY_MARGIN_SECONDS = 300
+
+
+def token_cache_path() -> Path:
+    return Path(os.getenv("ZOHO_TOKEN_CACHE_PATH", "") or DEFAULT_TOKEN_CACHE_PATH)
+
+
+def credentials_fingerprint(client_id: str, refresh_token: str) -> str:
+    """Identify the credentials a cached token belongs to without storing them."""
+    return hashlib.sha256(f"{client_id}:{refresh_token}".encode()).hexdigest()[:16]
+
+
+@contextmanager
+def locked_token_cache(path: Optional[Path] = None) -> Iterator[Path]:
+    """
+    Hold an exclusive lock on the token cache for a read-refresh-write cycle.
+
+    If the lock can't be taken (unwritable directory, no flock support),
+    the cycle runs unlocked: the worst case is one extra token refresh.
+    """
+    path = path or token_cache_path()
+    if fcntl is None:
+        yield path
+        return
+
+    try:
+        lock_file = open(path.with_name(path.name + ".lock"), "w")
+    except OSError as e:
+        print(f"  [WARN] Zoho token cache lock unavailable ({e}), continuing without it")
+        yield path
+        return
+
+    with lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except OSError as e:
+            print(f"  [WARN] Zoho token cache lock unavailable ({e}), continuing without it")
+            yield path
+            return
+        try:
+            yield path
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_cached_token(path: Path, fingerprint: str) -> Optional[dict]:
+    """
+    Return the cached token entry if it belongs to these credentials and is fresh.
+
+    Returns:
+        Dict with access_token, api_url, region and expires_at, or None
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("fingerprint") != fingerprint or not entry.get("access_token"):
+        return None
+    if entry.get("expires_at", 0) - EXPIRY_MARGIN_SECONDS <= time.time():
+        return None
+    return entry
+
+
+def write_cached_token(
+    path: Path,
+    fingerprint: str,
+    access_token: str,
+    api_url: str,
+    region: str,
+    expires_in: int,
+) -> float:
+    """Store a freshly issued token (owner-only permissions). Returns its expiry timestamp."""
+    expires_at = time.time() + expires_in
+    entry = {
+        "fingerprint": fingerprint,
+        "access_token": access_token,
+        "api_url": api_url,
+        "region": region,
+        "expires_at": expires_at,
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+    return expires_at
@@ -9,6 +9,10 @@ After Day 2 with no reply: Move to 'constant_no_answer'
 
 Runs daily at 10:00 AM IST via GitHub Actions.
 
+Phones come from the leads.normalized_phone column (migration 025). Until
+that migration is deployed, they are normalized client-side with the same
+normalize_phone(), so the runner can ship before or after it.
+
 Usage:
     uv run outreach_runner.py              # Production run
     uv run outreach_runner.py --dry-run    # Preview without sending
@@ -17,7 +21,6 @@ Usage:
 import argparse
 import logging
 import os
-import re
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -25,6 +28,7 @@ from typing import Any, Optional
 
 import httpx
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 from supabase import create_client, Client
 
 # ============================================
@@ -34,6 +38,10 @@ from supabase import create_client, Client
 CRM_DIR = Path(__file__).parent.parent.parent
 load_dotenv(CRM_DIR / ".env.local")
 
+# Same normalizer as the Zoho sync (and public.normalize_il_phone in the DB)
+sys.path.insert(0, str(CRM_DIR))
+from scripts.sync.phone_normalize import normalize_phone  # noqa: E402
+
 SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", os.environ.get("SUPABASE_URL", ""))
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", os.environ.get("SUPABASE_SERVICE_KEY", ""))
 
@@ -62,27 +70,9 @@ log = logging.getLogger("outreach")
 
 
 # ============================================
-# Phone normalization (inline from phone_normalize.py)
+# Phone normalization (shared with scripts/sync)
 # ============================================
 
-def normalize_phone(phone: Optional[str]) -> Optional[str]:
-    """Normalize Israeli phone to 10-digit format (05XXXXXXXX)."""
-    if not phone:
-        return None
-    digits = re.sub(r"\D", "", phone)
-    if not digits:
-        return None
-    if digits.startswith("972"):
-        digits = "0" + digits[3:]
-    if len(digits) == 9 and digits.startswith("5"):
-        digits = "0" + digits
-    if len(digits) == 10 and digits.startswith("05"):
-        return digits
-    if len(digits) >= 9 and digits.startswith("0"):
-        return digits
-    return digits if len(digits) >= 7 else None
-
-
 def phone_to_whatsapp(phone: Optional[str]) -> Optional[str]:
     """Convert normalized phone to WhatsApp chat ID format (972XXXXXXXXX@c.us)."""
     normalized = normalize_phone(phone)
@@ -201,15 +191,29 @@ def get_supabase() -> Client:
 def get_eligible_leads(sb: Client) -> list[dict[str, Any]]:
     """Get leads in no_answer status created in the last 30 days."""
     thirty_days_ago = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
-    result = (
-        sb.table(LEADS_TABLE)
-        .select("id, name, phone, status, created_at")
-        .eq("status", "no_answer")
-        .gte("created_at", thirty_days_ago)
-        .is_("deleted_at", "null")
-        .execute()
-    )
-    return result.data or []
+
+    def select(columns: str) -> list[dict[str, Any]]:
+        result = (
+            sb.table(LEADS_TABLE)
+            .select(columns)
+            .eq("status", "no_answer")
+            .gte("created_at", thirty_days_ago)
+            .is_("deleted_at", "null")
+            .execute()
+        )
+        return result.data or []
+
+    try:
+        return select("id, name, phone, normalized_phone, status, created_at")
+    except APIError as e:
+        # 42703 = undefined column: migration 025 is not deployed yet
+        if e.code != "42703":
+            raise
+    log.warning("leads.normalized_phone not found (migration 025), normalizing phones client-side")
+    leads = select("id, name, phone, status, created_at")
+    for lead in leads:
+        lead["normalized_phone"] = normalize_phone(lead.get("phone"))
+    return leads
 
 
 def get_outreach_history(sb: Client, lead_ids: list[str]) -> dict[str, list[dict]]:
@@ -297,7 +301,8 @@ def run_outreach(dry_run: bool = False) -> dict[str, int]:
     # 3. Process each lead
     for lead in leads:
         lead_id = lead["id"]
-        phone = lead.get("phone")
+        # normalized_phone is generated in the DB (migration 025) or by get_eligible_leads; same rules either way
+        phone = lead.get("normalized_phone") or lead.get("phone")
         name = lead.get("name", "Unknown")
         lead_history = history.get(lead_id, [])
         messages_sent = len(lead_history)
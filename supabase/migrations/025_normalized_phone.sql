@@ -0,0 +1,40 @@
+-- Normalized phone key for leads, so phone lookups can use an index.
+-- normalize_il_phone() mirrors normalize_phone() in scripts/sync/phone_normalize.py:
+--   1. keep ASCII digits only
+--   2. 972XXXXXXXX -> 0XXXXXXXX (international prefix)
+--   3. 5XXXXXXXX -> 05XXXXXXXX (missing leading zero)
+--   4. NULL if fewer than 7 digits remain
+-- Keep the two in sync; scripts/sync/phone_parity.py checks that they agree.
+--
+-- Deploy order: reconcile.py --supabase-pushdown filters on normalized_phone
+-- and needs this migration first. outreach_runner.py uses the column when
+-- present and falls back to normalizing client-side, so it can ship either way.
+
+CREATE OR REPLACE FUNCTION public.normalize_il_phone(phone TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT CASE WHEN length(d) >= 7 THEN d END
+    FROM (
+        SELECT CASE WHEN length(d1) = 9 AND d1 LIKE '5%' THEN '0' || d1 ELSE d1 END AS d
+        FROM (
+            SELECT CASE WHEN d0 LIKE '972%' THEN '0' || substr(d0, 4) ELSE d0 END AS d1
+            FROM (SELECT regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g') AS d0) AS digits
+        ) AS intl
+    ) AS mobile
+$$;
+
+ALTER TABLE public.leads
+    ADD COLUMN IF NOT EXISTS normalized_phone TEXT
+    GENERATED ALWAYS AS (public.normalize_il_phone(phone)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_phone ON public.leads(normalized_phone);
+
+-- Add to dev_leads table as well
+ALTER TABLE public.dev_leads
+    ADD COLUMN IF NOT EXISTS normalized_phone TEXT
+    GENERATED ALWAYS AS (public.normalize_il_phone(phone)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_dev_leads_normalized_phone ON public.dev_leads(normalized_phone);
@@ -0,0 +1,81 @@
+-- Atomic Zoho status sync for scripts/sync/status_sync.py (--apply-mode rpc).
+-- One call applies a batch of updates in a single transaction:
+--   1. custom_fields is merged server-side with jsonb ||, so keys edited
+--      concurrently (e.g. from the UI) are never overwritten
+--   2. status and updated_at are set
+--   3. a status_changed row is inserted into lead_events for every lead updated
+-- Returns one row per input update, in input order; applied = false means
+-- the lead does not exist.
+--
+-- updates: JSON array of
+--   {"supabase_id", "old_status", "new_status", "zoho_id", "zoho_notes", "match_type", "match_confidence"}
+-- target: 'dev' (dev_leads / dev_lead_events) or 'prod' (leads / lead_events)
+
+CREATE OR REPLACE FUNCTION public.sync_zoho_updates(updates JSONB, target TEXT DEFAULT 'dev')
+RETURNS TABLE (lead_id UUID, applied BOOLEAN)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    leads_table TEXT;
+    events_table TEXT;
+BEGIN
+    IF target = 'prod' THEN
+        leads_table := 'leads';
+        events_table := 'lead_events';
+    ELSIF target = 'dev' THEN
+        leads_table := 'dev_leads';
+        events_table := 'dev_lead_events';
+    ELSE
+        RAISE EXCEPTION 'Unknown sync target: %', target;
+    END IF;
+
+    RETURN QUERY EXECUTE format($sql$
+        WITH input AS (
+            SELECT
+                (u->>'supabase_id')::uuid AS id,
+                u->>'old_status' AS old_status,
+                u->>'new_status' AS new_status,
+                u->>'zoho_id' AS zoho_id,
+                NULLIF(u->>'zoho_notes', '') AS zoho_notes,
+                u->>'match_type' AS match_type,
+                (u->>'match_confidence')::float8 AS match_confidence,
+                t.position
+            FROM jsonb_array_elements($1) WITH ORDINALITY AS t(u, position)
+        ),
+        updated AS (
+            UPDATE public.%1$I AS l
+            SET status = i.new_status,
+                custom_fields = coalesce(l.custom_fields, '{}'::jsonb)
+                    || jsonb_build_object('zoho_id', i.zoho_id)
+                    || CASE WHEN i.zoho_notes IS NULL THEN '{}'::jsonb
+                            ELSE jsonb_build_object('zoho_notes', i.zoho_notes) END,
+                updated_at = now()
+            FROM input i
+            WHERE l.id = i.id
+            RETURNING l.id
+        ),
+        events AS (
+            INSERT INTO public.%2$I (lead_id, event_type, field_name, old_value, new_value, user_email, metadata)
+            SELECT
+                i.id, 'status_changed', 'status', i.old_status, i.new_status, 'sync@zoho-reconciliation',
+                jsonb_build_object(
+                    'source', 'zoho_sync',
+                    'zoho_id', i.zoho_id,
+                    'match_type', i.match_type,
+                    'match_confidence', i.match_confidence
+                )
+            FROM input i
+            JOIN updated u ON u.id = i.id
+            ORDER BY i.position
+        )
+        SELECT i.id, u.id IS NOT NULL
+        FROM input i
+        LEFT JOIN updated u ON u.id = i.id
+        ORDER BY i.position
+    $sql$, leads_table, events_table) USING updates;
+END;
+$$;
+
+-- Only the sync (service key) may call it through /rest/v1/rpc/
+REVOKE EXECUTE ON FUNCTION public.sync_zoho_updates(JSONB, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.sync_zoho_updates(JSONB, TEXT) TO service_role;
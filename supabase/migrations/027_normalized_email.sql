@@ -0,0 +1,31 @@
+-- Normalized email key for leads, so email lookups can use an index.
+-- normalize_email() mirrors the key the sync matcher uses in
+-- scripts/sync/reconcile.py (email.lower().strip()):
+--   1. trim surrounding whitespace
+--   2. lowercase
+--   3. NULL if nothing is left
+--
+-- Deploy order: reconcile.py / status_sync.py --supabase-pushdown filter on
+-- normalized_email and need this migration (and 025) first.
+
+CREATE OR REPLACE FUNCTION public.normalize_email(email TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT NULLIF(lower(btrim(email, E' \t\n\r\f\v')), '')
+$$;
+
+ALTER TABLE public.leads
+    ADD COLUMN IF NOT EXISTS normalized_email TEXT
+    GENERATED ALWAYS AS (public.normalize_email(email)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_email ON public.leads(normalized_email);
+
+-- Add to dev_leads table as well
+ALTER TABLE public.dev_leads
+    ADD COLUMN IF NOT EXISTS normalized_email TEXT
+    GENERATED ALWAYS AS (public.normalize_email(email)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_dev_leads_normalized_email ON public.dev_leads(normalized_email);
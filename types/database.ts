@@ -419,6 +419,7 @@ export type Database = {
           last_name: string | null
           last_seen: string | null
           name: string
+          normalized_phone: string | null
           phone: string | null
           playbook_id: string | null
           probability: number | null